@@ -0,0 +1,58 @@
+"""Benchmark the heuristics that order the guesses in :meth:`sudoku.Board.step`.
+
+For each combination of ``tile_order`` and ``value_order``, this script solves a set of
+problems and reports the number of guesses per problem and the solving time. By default,
+the problems are the boards in ``data/``, and other files in any format accepted by
+``sudoku-solve`` can be given instead::
+
+    $ python benchmarks/bench_heuristics.py
+    $ python benchmarks/bench_heuristics.py hard_boards.txt
+"""
+
+import argparse
+import glob
+import itertools
+import os
+import statistics
+import time
+
+from sudoku import Board
+from sudoku.board import tile_orders, value_orders
+from sudoku.formats import parse_boards
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("files", nargs="*")
+    arg_parser.add_argument("--seed", type=int, default=0)
+    args = arg_parser.parse_args()
+
+    files = args.files or sorted(glob.glob(os.path.join(root, "data", "board_*.json")))
+    problems = []
+    for filename in files:
+        with open(filename, "r") as f:
+            problems.extend(parse_boards(f.read()))
+
+    print(f"{len(problems)} problems")
+    print(
+        f"{'tile_order':<12}{'value_order':<13}{'mean guesses':>14}"
+        f"{'max guesses':>13}{'total time [s]':>16}"
+    )
+    for tile_order, value_order in itertools.product(tile_orders, value_orders):
+        nguesses = []
+        start_time = time.perf_counter()
+        for problem in problems:
+            board = Board(problem, tile_order, value_order, seed=args.seed)
+            board.solve()
+            nguesses.append(board.nguesses)
+        total_time = time.perf_counter() - start_time
+        print(
+            f"{tile_order:<12}{value_order:<13}{statistics.mean(nguesses):>14.2f}"
+            f"{max(nguesses):>13}{total_time:>16.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Benchmark the memory used by :meth:`sudoku.Board.solve` and
+:func:`sudoku.generate_problem`.
+
+For each target, this script reports the peak traced memory and the memory retained
+after a single call and after ``--nrepeat`` calls (1000 by default), measured with
+:func:`sudoku.memory.measure_memory`, in total and per call. The blocks are the memory
+blocks still allocated after the calls, not the number of allocations made. If any
+value exceeds its budget, the script exits with a non-zero status, so it can be used to
+catch memory regressions. Tracing the allocations slows the solver down several times,
+so the default 1000 calls take a while; use ``--nrepeat`` for a quicker check::
+
+    $ python benchmarks/bench_memory.py
+    $ python benchmarks/bench_memory.py --nrepeat 100 --target solve
+"""
+
+import argparse
+import glob
+import itertools
+import json
+import os
+import sys
+
+import numpy as np
+
+from sudoku import Board, generate_problem
+from sudoku.memory import measure_memory, check_budget
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+board_files = sorted(glob.glob(os.path.join(root, "data", "board_*.json")))
+problems = itertools.cycle([json.load(open(f, "r"))["board"] for f in board_files])
+
+
+def solve():
+    Board(next(problems)).solve()
+
+
+def generate():
+    generate_problem(3)
+
+
+targets = {"solve": solve, "generate": generate}
+
+# Budgets for a single call and for the repeated calls. The peak is the memory needed
+# by one call, and the memory retained after the repeated calls should not grow with
+# the number of calls.
+budgets = {
+    "solve": {
+        "single": {"peak_bytes": 1024 * 1024, "retained_bytes": 16 * 1024},
+        "repeated": {"peak_bytes": 1024 * 1024, "retained_bytes": 64 * 1024},
+    },
+    "generate": {
+        "single": {"peak_bytes": 1024 * 1024, "retained_bytes": 16 * 1024},
+        "repeated": {"peak_bytes": 1024 * 1024, "retained_bytes": 64 * 1024},
+    },
+}
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("-n", "--nrepeat", type=int, default=1000)
+    arg_parser.add_argument("--target", choices=list(targets), action="append")
+    arg_parser.add_argument("--seed", type=int, default=0)
+    args = arg_parser.parse_args()
+
+    np.random.seed(args.seed)
+    violations = []
+    print(
+        f"{'target':<10}{'calls':>7}{'peak [KiB]':>12}{'retained [KiB]':>16}"
+        f"{'retained blocks':>17}{'retained [B/call]':>19}"
+        f"{'retained blocks/call':>22}"
+    )
+    for name in args.target or list(targets):
+        for label, nrepeat in [("single", 1), ("repeated", args.nrepeat)]:
+            report = measure_memory(targets[name], nrepeat)
+            print(
+                f"{name:<10}{nrepeat:>7}{report['peak_bytes'] / 1024:>12.1f}"
+                f"{report['retained_bytes'] / 1024:>16.1f}"
+                f"{report['retained_blocks']:>17}"
+                f"{report['retained_bytes'] / nrepeat:>19.1f}"
+                f"{report['retained_blocks'] / nrepeat:>22.3f}"
+            )
+            for violation in check_budget(report, budgets[name][label]):
+                violations.append(f"{name}, {nrepeat} calls: {violation}")
+
+    for violation in violations:
+        print("Budget exceeded:", violation, file=sys.stderr)
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
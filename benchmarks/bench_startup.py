@@ -0,0 +1,95 @@
+"""Benchmark the startup time of the command line tool.
+
+This script runs ``python -X importtime`` on the imports done by ``sudoku-solve`` and
+reports the total import time, the slowest imports, and whether NumPy is imported. It
+also reports the wall time of solving a single board in a fresh interpreter, which is
+what short-lived jobs that call the command line tool pay for each call.
+
+Run it from the root of the repository::
+
+    $ python benchmarks/bench_startup.py
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+env = dict(os.environ, PYTHONPATH=root + os.pathsep + os.environ.get("PYTHONPATH", ""))
+
+data = json.load(open(os.path.join(root, "data", "board_01.json"), "r"))
+board_string = "".join(str(val) for row in data["board"] for val in row)
+
+# Solve one board as the console script does, then report whether NumPy is imported
+cli_code = (
+    "import sys; from sudoku.main import main; main(['-o', 'line', sys.argv[1]]); "
+    "print('numpy' in sys.modules, file=sys.stderr)"
+)
+
+
+def import_times(code):
+    """Run the code with ``-X importtime`` and parse the cumulative import time of each
+    module, in microseconds.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code, board_string],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        # Top-level imports have the smallest indentation
+        depth = (len(name) - len(name.lstrip())) // 2
+        times[name.strip()] = (int(cumulative), depth)
+    numpy_imported = result.stderr.strip().splitlines()[-1] == "True"
+    return times, numpy_imported
+
+
+def wall_times(code, nrepeat):
+    """Wall time of running the code in a fresh interpreter, in seconds."""
+    times = []
+    for _ in range(nrepeat):
+        start_time = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-c", code, board_string],
+            env=env,
+            capture_output=True,
+            check=True,
+        )
+        times.append(time.perf_counter() - start_time)
+    return times
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("-n", "--nrepeat", type=int, default=10)
+    arg_parser.add_argument("-k", "--top", type=int, default=10)
+    args = arg_parser.parse_args()
+
+    baseline = wall_times("pass", args.nrepeat)
+    cli = wall_times(cli_code, args.nrepeat)
+    times, numpy_imported = import_times(cli_code)
+    top_level = {name: t for name, (t, depth) in times.items() if depth == 0}
+
+    print(f"Interpreter startup:    {statistics.median(baseline) * 1e3:8.2f} ms")
+    print(f"sudoku-solve, 1 board:  {statistics.median(cli) * 1e3:8.2f} ms")
+    print(f"Total import time:      {sum(top_level.values()) / 1e3:8.2f} ms")
+    print(f"NumPy imported:         {numpy_imported}")
+    print()
+    print(f"Slowest {args.top} imports (cumulative):")
+    slowest = sorted(times.items(), key=lambda item: item[1][0], reverse=True)
+    for name, (t, _) in slowest[: args.top]:
+        print(f"  {t / 1e3:8.2f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
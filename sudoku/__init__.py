@@ -1,6 +1,48 @@
-from .main import main
-from .board import Board
-from .generate_problem import generate_problem
+import importlib
+import sys
+import types
 
 
 __version__ = "1.2.0"
+
+# The public names and the submodules that define them. The submodules, and NumPy with
+# them, are only imported when a name is first accessed, so that ``import sudoku`` and
+# the command line tool start fast.
+_lazy_names = {
+    "main": "main",
+    "Board": "board",
+    "generate_problem": "generate_problem",
+    "generate_problems": "generate_problem",
+    "solve_many_async": "aio",
+    "solve_portfolio": "portfolio",
+    "solve_parallel": "parallel",
+}
+__all__ = list(_lazy_names)
+
+
+def __getattr__(name):
+    if name in _lazy_names:
+        module = importlib.import_module(f".{_lazy_names[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+class _Package(types.ModuleType):
+    """Importing a submodule sets it as an attribute of the package. For ``main`` and
+    ``generate_problem``, keep the attribute pointing to the function of the same name,
+    as it is when the package is imported eagerly.
+    """
+
+    def __setattr__(self, name, value):
+        if isinstance(value, types.ModuleType) and _lazy_names.get(name) == name:
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
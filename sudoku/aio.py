@@ -0,0 +1,95 @@
+"""Solve Sudoku problems from an asyncio application without blocking the event loop.
+
+There are two modes. By default, each problem is solved with
+:meth:`~sudoku.Board.solve_async`, which cooperatively yields to the event loop every
+few steps. Alternatively, an executor can be given, in which case the solves run in the
+executor's threads or processes and the event loop only awaits the results.
+"""
+
+import asyncio
+from concurrent.futures import Executor
+from typing import Iterable, List, Optional
+
+import numpy as np
+
+from .board import Board
+
+
+def _solve_array(board: np.ndarray) -> np.ndarray:
+    """Solve a board array and return the solved array. This is a module-level function
+    so that it can be sent to a process pool.
+    """
+    B = Board(board)
+    B.solve()
+    return B.board
+
+
+async def _solve_one(
+    board: Board,
+    yield_every: int,
+    executor: Optional[Executor],
+    timeout: Optional[float],
+    semaphore: asyncio.Semaphore,
+) -> Board:
+    """Solve a single board, while respecting the concurrency limit."""
+    async with semaphore:
+        if executor is None:
+            coro = board.solve_async(yield_every=yield_every)
+        else:
+            loop = asyncio.get_running_loop()
+            coro = loop.run_in_executor(executor, _solve_array, board.board)
+        result = await asyncio.wait_for(coro, timeout)
+        if executor is not None:
+            board.board = result
+    return board
+
+
+async def solve_many_async(
+    boards: Iterable,
+    concurrency: int = 8,
+    yield_every: int = 1,
+    executor: Optional[Executor] = None,
+    timeout: Optional[float] = None,
+) -> List[Board]:
+    """Solve many Sudoku problems concurrently on the running event loop.
+
+    Parameters
+    ----------
+    boards: iterable
+        The problems to solve. Each element can be a :class:`~sudoku.Board` instance
+        or a :math:`9 \\times 9` array-like.
+    concurrency: int
+        Maximum number of problems that are solved at the same time.
+    yield_every: int
+        Number of steps to run before yielding to the event loop. This is only used
+        when no executor is given.
+    executor: :class:`concurrent.futures.Executor`
+        If given, the problems are solved in this executor instead of on the event
+        loop. The executor is managed by the caller.
+    timeout: float
+        Maximum time, in seconds, to solve each problem. :class:`asyncio.TimeoutError`
+        is raised if any problem exceeds it. Note that a solve that already runs in an
+        executor thread can't be interrupted; only its result is discarded.
+
+    Returns
+    -------
+    list
+        A list of solved :class:`~sudoku.Board` instances, in the same order as the
+        input.
+    """
+    assert concurrency > 0, "concurrency should be a positive integer"
+    boards = [b if isinstance(b, Board) else Board(b) for b in boards]
+    semaphore = asyncio.Semaphore(concurrency)
+    tasks = [
+        asyncio.ensure_future(
+            _solve_one(board, yield_every, executor, timeout, semaphore)
+        )
+        for board in boards
+    ]
+    try:
+        return list(await asyncio.gather(*tasks))
+    finally:
+        # Don't leave the other solves running if one of them fails or if the caller
+        # is cancelled.
+        for task in tasks:
+            task.cancel()
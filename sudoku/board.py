@@ -1,11 +1,17 @@
+import asyncio
 import copy
 import time
 from datetime import timedelta
-from typing import List, Callable, Dict
+from typing import List, Callable, Dict, Iterator, Optional, Tuple
 
 import numpy as np
 
 from sudoku.tile import Tile
+from sudoku.formats import format_grid
+from sudoku.solver import iter_solutions, tile_orders, value_orders
+from sudoku.portfolio import solve_portfolio
+from sudoku.parallel import solve_parallel
+from sudoku.trace import Tracer, null_span
 
 
 def default_callback(board):
@@ -32,6 +38,30 @@ class Board:
         :math:`9 \times 9` array-like, where the elements of the array give
         show the value in each corresponding tile. The value of zero means that
         the tile is empty.
+    tile_order: str {"mrv", "mrv_reverse", "static", "mrv_degree", "dom_wdeg"}
+        How to order the empty tiles to guess when the search gets stuck.
+        ``"mrv"`` tries the tiles with the fewest possible values first.
+        ``"mrv_reverse"`` does the same, but breaks the ties by trying the last
+        tile first. ``"static"`` tries the first empty tile in row-major order.
+        ``"mrv_degree"`` does the same as ``"mrv"``, and breaks the ties by
+        trying first the tiles that share a row, column, or block with the most
+        empty tiles.
+        ``"dom_wdeg"`` tries first the tiles with the lowest ratio between the
+        number of possible values and the weights of their row, column, and
+        block, where the weights count how many times the search fails in them.
+    value_order: str {"ascending", "descending", "lcv", "random"}
+        How to order the values to try in a tile. ``"ascending"`` and
+        ``"descending"`` try the values in ascending and descending order.
+        ``"lcv"`` tries first the least constraining
+        values, i.e., the values that are possible in the fewest other empty
+        tiles in the same row, column, or block. ``"random"`` shuffles the
+        values, using ``seed``.
+    seed: int
+        Seed of the random number generator used by ``value_order="random"``.
+
+    The heuristics are the same as the options of
+    :func:`~sudoku.solver.solve_board`, which is used by :meth:`solve` with a
+    portfolio or several workers.
 
     Attributes
     ----------
@@ -41,19 +71,93 @@ class Board:
     orig_board: np.adarray (9, 9,)
         An array that represent the initial state of the Sudoku board that
         shows the problem.
+    nguesses: int
+        Number of times a tile is set to a guessed value during the solving
+        process.
 
     Notes
     -----
     We will call a block to refer to a :math:`3 \times 3` block in which no
     numbers can be repeated in that block.
+
+    The boards are stored as contiguous ``uint8`` arrays, i.e., 81 bytes per
+    board. If the input is already such an array (see :meth:`from_buffer`),
+    ``orig_board`` is a view of it and no copy is made. ``board`` is always a
+    separate copy, since it is mutated during the solving process.
     """
 
-    def __init__(self, board: np.ndarray):
-        self.board = np.asarray(board)
-        self.orig_board = copy.copy(self.board)
-        assert self.board.shape == (9, 9), ("The board should be a 9x9 array-like",)
+    dtype = np.uint8
+
+    def __init__(
+        self,
+        board: np.ndarray,
+        tile_order: str = "mrv",
+        value_order: str = "ascending",
+        seed: Optional[int] = None,
+    ):
+        # Check the values before narrowing the type, which would wrap them around
+        values = np.asarray(board)
+        assert values.shape == (9, 9), "The board should be a 9x9 array-like"
+        assert values.dtype.kind in "biuf", "The values should be integers"
+        if values.dtype.kind == "f":
+            assert np.all(values == np.round(values)), "The values should be integers"
+        assert np.all((values >= 0) & (values <= 9)), (
+            "The values should be between 0 and 9"
+        )
+        self.orig_board = np.ascontiguousarray(values, dtype=self.dtype)
+        assert tile_order in tile_orders, f"tile_order should be one of {tile_orders}"
+        assert value_order in value_orders, (
+            f"value_order should be one of {value_orders}"
+        )
+        self.board = self.orig_board.copy()
+        self.tile_order = tile_order
+        self.value_order = value_order
+        self.seed = seed
+        self._rng = np.random.default_rng(seed)
+        self._unit_weights = np.ones(27, dtype=int)
         self._intermediate_state = {}
         self.niter = 0
+        self.nguesses = 0
+        self.portfolio_winner = None
+        self.tracer = None
+
+    @classmethod
+    def from_string(cls, string: str, **kwargs) -> "Board":
+        """Create a board from an 81-character string, listing the tiles row by
+        row. Empty tiles are written as "0" or ".".
+
+        The conversion from characters to values is done in a single
+        vectorized operation, without creating a Python object per tile.
+        """
+        if isinstance(string, str):
+            string = string.encode("ascii")
+        string = bytes(string).strip().replace(b".", b"0")
+        assert len(string) == 81, "The string should contain 81 characters"
+        values = np.frombuffer(string, dtype=cls.dtype) - ord("0")
+        return cls(values.reshape(9, 9), **kwargs)
+
+    @classmethod
+    def from_buffer(cls, buffer, offset: int = 0, **kwargs) -> "Board":
+        """Create a board from 81 bytes in a buffer, without copying the data.
+
+        The buffer can be any object that supports the buffer protocol, e.g.,
+        ``bytes``, ``bytearray``, ``memoryview``, or ``mmap.mmap``. Each byte
+        holds the value of one tile, row by row, with 0 for an empty tile. This
+        is the same layout as produced by :meth:`to_bytes`, so many boards can
+        be stored back to back and read with ``offset=81 * index``.
+        """
+        values = np.frombuffer(buffer, dtype=cls.dtype, count=81, offset=offset)
+        return cls(values.reshape(9, 9), **kwargs)
+
+    def to_bytes(self) -> bytes:
+        """Return the current board as 81 bytes, see :meth:`from_buffer`."""
+        return self.board.tobytes()
+
+    def _span(self, name: str, **args):
+        """Record a span of the solving process if a tracer is set."""
+        if self.tracer is None:
+            return null_span
+        return self.tracer.span(name, **args)
 
     @property
     def tiles(self) -> Tile:
@@ -108,107 +212,333 @@ class Board:
         else:
             return False
 
-    def solve(self, callback: Callable = default_callback, verbose: bool = False):
-        """Main method to solve the Sudoku problem."""
+    def solve(
+        self,
+        callback: Callable = default_callback,
+        verbose: bool = False,
+        portfolio: Optional[List[Dict]] = None,
+        workers: Optional[int] = None,
+        tracer: Optional[Tracer] = None,
+    ) -> Optional[Dict]:
+        """Main method to solve the Sudoku problem.
+
+        Parameters
+        ----------
+        callback: callable
+            A function called after each step, see :func:`default_callback`.
+        verbose: bool
+            Print the steps of the solving process and the solving time.
+        portfolio: list
+            If given, race the configurations in this list in parallel processes
+            instead of running the steps, see
+            :func:`~sudoku.portfolio.solve_portfolio`. The ``tile_order``,
+            ``value_order``, and ``seed`` of the board are used for the options
+            that a configuration doesn't set. The callback is not used in this
+            case.
+        workers: int
+            If given, split the search tree of the problem over this many
+            processes instead of running the steps, see
+            :func:`~sudoku.parallel.solve_parallel`, with the ``tile_order``,
+            ``value_order``, and ``seed`` of the board. The callback is not used
+            in this case.
+        tracer: :class:`~sudoku.trace.Tracer`
+            If given, record the time spent in each phase of the solving process,
+            i.e., the propagation passes and rules, the guesses, and the reverts.
+
+        Returns
+        -------
+        dict
+            The configuration of the portfolio that finished first, which is also
+            stored in the ``portfolio_winner`` attribute. None if no portfolio is
+            given.
+        """
 
+        assert portfolio is None or workers is None, (
+            "Only one of portfolio and workers can be given"
+        )
+        # The tracer is only used for this solve
+        previous_tracer = self.tracer
+        if tracer is not None:
+            self.tracer = tracer
+        start_time = time.perf_counter()
+        config = None
+        try:
+            if portfolio is not None or workers is not None:
+                options = {
+                    "tile_order": self.tile_order,
+                    "value_order": self.value_order,
+                    "seed": self.seed,
+                }
+                if portfolio is not None:
+                    portfolio = [dict(options, **config) for config in portfolio]
+                    solution, config = solve_portfolio(self.board, portfolio)
+                    self.portfolio_winner = config
+                else:
+                    solution = solve_parallel(self.board, workers, **options)
+                if solution is None:
+                    raise ValueError("The Sudoku problem has no solution")
+                self.board = np.array(solution, dtype=self.dtype)
+            else:
+                with self._span("solve"):
+                    while True:
+                        with self._span("check_solved"):
+                            if self.solved:
+                                break
+                        self.step(callback, verbose)
+                # The stored states are only needed during the search
+                self._intermediate_state.clear()
+        finally:
+            self.tracer = previous_tracer
+        finish_time = time.perf_counter()
+        if verbose:
+            if config is not None:
+                print("Solved with configuration:", config)
+            print("Solving time:", timedelta(seconds=finish_time - start_time))
+        return config
+
+    async def solve_async(
+        self,
+        callback: Callable = default_callback,
+        verbose: bool = False,
+        yield_every: int = 1,
+    ):
+        """Asynchronous version of :meth:`solve`, which runs the same steps but
+        yields control back to the event loop every ``yield_every`` steps. This
+        way, a slow puzzle doesn't stall the other tasks running on the same loop.
+
+        The coroutine supports the standard asyncio cancellation and timeout, e.g.,
+        ``await asyncio.wait_for(board.solve_async(), timeout=1.0)``. If the solve
+        is cancelled, the board is left in its intermediate state and can be
+        restored with :meth:`reset`.
+
+        Parameters
+        ----------
+        callback: callable
+            A function called after each step, see :func:`default_callback`.
+        verbose: bool
+            Print the steps of the solving process and the solving time.
+        yield_every: int
+            Number of steps to run before yielding to the event loop.
+        """
+        assert yield_every > 0, "yield_every should be a positive integer"
         start_time = time.perf_counter()
+        nsteps = 0
         while not self.solved:
             self.step(callback, verbose)
+            nsteps += 1
+            if nsteps % yield_every == 0:
+                await asyncio.sleep(0)
+        self._intermediate_state.clear()
         finish_time = time.perf_counter()
         if verbose:
             print("Solving time:", timedelta(seconds=finish_time - start_time))
 
+    def iter_solutions(self) -> Iterator[np.ndarray]:
+        """Iterate over all solutions of the Sudoku problem in ``orig_board``.
+
+        The solutions are generated lazily by a depth-first search that resumes
+        each time the next solution is requested, and the memory used by the
+        search is bounded by its depth. Thus, the consumer can stop early, e.g.,
+        with ``itertools.islice(board.iter_solutions(), k)`` to get the first
+        ``k`` solutions, or stream all solutions of an under-constrained board.
+        This method doesn't change ``board``.
+
+        Yields
+        ------
+        np.ndarray (9, 9,)
+            Each solution of the problem.
+        """
+        for solution in iter_solutions(self.orig_board):
+            yield np.array(solution, dtype=self.dtype)
+
     def step(self, callback: Callable = default_callback, verbose: bool = False):
         """Run one step of the algorithm."""
+        search_depth = len(self._intermediate_state)
+        with self._span("step", niter=self.niter, search_depth=search_depth):
+            self._step(verbose)
+        self.niter += 1
+        callback(self)
+
+    def _step(self, verbose: bool = False):
+        """Run one step of the algorithm, without updating the iteration number."""
         # Try updating the tiles by looking up and comparing the lists of
         # possible values.
-        old_tiles = copy.deepcopy(self.tiles)  # Tiles before the update
-        self._lookup_possible_values()
-        new_tiles = copy.deepcopy(self.tiles)  # Tiles after the update
+        with self._span("snapshot"):
+            old_tiles = copy.deepcopy(self.tiles)  # Tiles before the update
+        with self._span("propagate"):
+            self._lookup_possible_values()
+        with self._span("snapshot"):
+            new_tiles = copy.deepcopy(self.tiles)  # Tiles after the update
 
         # Compare the tiles before and after the update. If the above algorithm
         # fails to update the tiles, then try setting one of the tile to a
         # value.
-        if self._tiles_same(old_tiles, new_tiles):
+        with self._span("compare"):
+            same = self._tiles_same(old_tiles, new_tiles)
+        if same:
             # Store the current state so that we can go back latger if needed.
             self._update_intermediate_state()
-
-            # List the number of possible values for each empty tile.
-            nposs_vals = np.array(
-                [len(tile.possible_values) for tile in self.empty_tiles]
-            )
-
-            if 0 in nposs_vals:
+            state = self._intermediate_state[self.niter]
+
+            # List the guesses to try from this state, i.e., the tiles and
+            # values ordered by the heuristics. The list is stored with the
+            # state, so that the order doesn't change when we come back to the
+            # same state.
+            if state["choices"] is None:
+                with self._span("branch", search_depth=len(self._intermediate_state)):
+                    state["choices"] = self._branching_choices()
+            choices = state["choices"]
+
+            # This index value is to pick the guess to try. It is incremented
+            # by 1 if we end up at the same state, so that we won't try setting
+            # the same tile to the same value twice.
+            idx_search = state["search_idx"]
+
+            if not choices:
                 # There are empty tiles with no possible values. The trial
                 # fails and need to be reset to the previous state.
                 self._revert_state()
                 if verbose:
                     print(f"Search fails, reverting to iteration {self.niter}")
+            elif idx_search < len(choices):
+                # Worth a try. Set the tile to the value and see if it works.
+                row, column, value = choices[idx_search]
+                if verbose:
+                    print(f"Try setting tile [{row}, {column}] to {value}")
+                self.board[row, column] = value
+                self.nguesses += 1
+                if self.tracer is not None:
+                    self.tracer.instant(
+                        "guess",
+                        row=row,
+                        column=column,
+                        value=value,
+                        search_depth=len(self._intermediate_state),
+                    )
             else:
-                # Worth a try. Find the empty tile with fewest possible values.
-                # Then, set that tile to one of the number and see if it works.
-                # Sort the arrays
-                idx_sorted = np.argsort(nposs_vals)
-                nposs_vals = nposs_vals[idx_sorted]
-                tiles = np.array(self.empty_tiles)[idx_sorted]
-
-                # This index value is to pick the value to set. It is
-                # incremented by 1 if we end up at the same state, so that we
-                # won't try setting the same tile to the same value twice.
-                idx_search = self._intermediate_state[self.niter]["search_idx"]
-
-                # Since we have taken care if there is empty list with 0
-                # possible value, then the lowest nposs_vals is 2. But, we
-                # still need to terminate if we exhaust the tiles and
-                # possible values.
-                if idx_search < sum(nposs_vals):
-                    # Find which tile and what value to try. We will start
-                    # with the empty tile with lowest possible value. Index
-                    # stored in _intermediate_state assumes we flatten the
-                    # possible values.
-                    for ii in range(len(nposs_vals)):
-                        nvals = np.sum(nposs_vals[: ii + 1])
-                        if not nvals < idx_search:
-                            idx_tile = ii
-                            idx_val = idx_search - np.sum(nposs_vals[:ii])
-                            break
-                    tile = tiles[idx_tile]
-                    value = tile.possible_values[idx_val]
-                    if verbose:
-                        print(
-                            f"Try setting tile [{tile.row}, {tile.column}] " f"to {value}"
-                        )
-                    tile.value = value
-                    self.board = tile.board
-                else:
-                    # If on a board we have tried all possible tiles and
-                    # values but still not succeeded, we need to go back 1
-                    # step.
-                    self._revert_state()
-                    if verbose:
-                        print(
-                            "No more values to try, "
-                            f"reverting to iteration {self.niter + 1}"
-                        )
-        self.niter += 1
-        callback(self)
+                # If on a board we have tried all possible tiles and values but
+                # still not succeeded, we need to go back 1 step.
+                self._revert_state()
+                if verbose:
+                    print(
+                        "No more values to try, "
+                        f"reverting to iteration {self.niter + 1}"
+                    )
+
+    def _branching_choices(self) -> List[Tuple[int, int, int]]:
+        """List the guesses, as (row, column, value), to try from the current
+        state. The tile to guess and the order of the values are chosen by the
+        heuristics. Returns an empty list if there is an empty tile with no
+        possible values.
+        """
+        tiles = self.empty_tiles
+        poss_vals = [tile.possible_values for tile in tiles]
+        nposs_vals = np.array([len(vals) for vals in poss_vals])
+        if 0 in nposs_vals:
+            # Put more weight on the rows, columns, and blocks where the search
+            # fails.
+            for tile, vals in zip(tiles, poss_vals):
+                if not vals:
+                    for unit in self._tile_units(tile.row, tile.column):
+                        self._unit_weights[unit] += 1
+            return []
+
+        # Only the values of the first tile need to be tried. If none of them
+        # works, there is no solution from this state, and trying other tiles
+        # only repeats the same search.
+        ii = self._order_tiles(tiles, nposs_vals)[0]
+        tile = tiles[ii]
+        values = self._order_values(tile, poss_vals[ii], tiles, poss_vals)
+        return [(tile.row, tile.column, val) for val in values]
+
+    @staticmethod
+    def _tile_units(row: int, column: int) -> Tuple[int, int, int]:
+        """Indices of the row, column, and block of a tile, out of 27 units."""
+        return row, 9 + column, 18 + 3 * (row // 3) + column // 3
+
+    def _order_tiles(self, tiles: List[Tile], nposs_vals: np.ndarray) -> List[int]:
+        """Order the empty tiles to guess, see ``tile_order``."""
+        if self.tile_order == "mrv":
+            return list(np.argsort(nposs_vals))
+        elif self.tile_order == "mrv_reverse":
+            order = np.argsort(nposs_vals[::-1], kind="stable")
+            return list(len(tiles) - 1 - order)
+        elif self.tile_order == "static":
+            return list(range(len(tiles)))
+
+        # Number of empty tiles in each row, column, and block
+        nempty = np.zeros(27, dtype=int)
+        for tile in tiles:
+            nempty[list(self._tile_units(tile.row, tile.column))] += 1
+        keys = []
+        for tile, nvals in zip(tiles, nposs_vals):
+            units = list(self._tile_units(tile.row, tile.column))
+            if self.tile_order == "mrv_degree":
+                # Number of other empty tiles in the same units, where the
+                # overlap between the block and the row or column is only
+                # counted once.
+                degree = len(
+                    [
+                        tl
+                        for tl in tiles
+                        if tl is not tile
+                        and set(units) & set(self._tile_units(tl.row, tl.column))
+                    ]
+                )
+                keys.append((nvals, -degree))
+            else:
+                # Weights of the units that have other empty tiles
+                wdeg = np.sum(self._unit_weights[units] * (nempty[units] > 1))
+                keys.append((nvals / wdeg if wdeg else np.inf,))
+        return sorted(range(len(tiles)), key=lambda ii: keys[ii])
+
+    def _order_values(
+        self,
+        tile: Tile,
+        values: List[int],
+        tiles: List[Tile],
+        poss_vals: List[List[int]],
+    ) -> List[int]:
+        """Order the values to try in a tile, see ``value_order``."""
+        if self.value_order == "ascending":
+            return values
+        elif self.value_order == "descending":
+            return values[::-1]
+        elif self.value_order == "random":
+            return [int(val) for val in self._rng.permutation(values)]
+
+        # Least constraining value: try first the values that are possible in
+        # the fewest other empty tiles in the same row, column, or block.
+        units = set(self._tile_units(tile.row, tile.column))
+        peer_vals = [
+            vals
+            for tl, vals in zip(tiles, poss_vals)
+            if tl is not tile and units & set(self._tile_units(tl.row, tl.column))
+        ]
+        return sorted(values, key=lambda val: sum(val in vals for vals in peer_vals))
 
     def _lookup_possible_values(self):
         """Update the tiles by looking at the lists of possible values."""
-        self._look_for_single_possible_value()
-        for block in range(9):
-            tiles_block = [
-                tile for tile in self.tiles if tile.block[0] == block and tile.empty
-            ]
-            self._look_for_single_occurence(tiles_block)
-        for row in range(9):
-            tiles_row = [tile for tile in self.tiles if tile.row == row and tile.empty]
-            self._look_for_single_occurence(tiles_row)
-        for column in range(9):
-            tiles_column = [
-                tile for tile in self.tiles if tile.column == column and tile.empty
-            ]
-        self._look_for_single_occurence(tiles_column)
+        with self._span("single_possible_value"):
+            self._look_for_single_possible_value()
+        with self._span("single_occurence_block"):
+            for block in range(9):
+                tiles_block = [
+                    tile for tile in self.tiles if tile.block[0] == block and tile.empty
+                ]
+                self._look_for_single_occurence(tiles_block)
+        with self._span("single_occurence_row"):
+            for row in range(9):
+                tiles_row = [
+                    tile for tile in self.tiles if tile.row == row and tile.empty
+                ]
+                self._look_for_single_occurence(tiles_row)
+        with self._span("single_occurence_column"):
+            for column in range(9):
+                tiles_column = [
+                    tile for tile in self.tiles if tile.column == column and tile.empty
+                ]
+            self._look_for_single_occurence(tiles_column)
 
     def _look_for_single_possible_value(self):
         """Look at the empty tiles of the entire board. To solve the block, we
@@ -251,7 +581,13 @@ class Board:
         if self.niter not in self._intermediate_state:
             # Store the intermediate state
             self._intermediate_state.update(
-                {self.niter: {"board": copy.copy(self.board), "search_idx": 0}}
+                {
+                    self.niter: {
+                        "board": copy.copy(self.board),
+                        "search_idx": 0,
+                        "choices": None,
+                    }
+                }
             )
         else:
             # Update the search index so we won't set the same tile with the
@@ -260,10 +596,16 @@ class Board:
 
     def _revert_state(self):
         """Revert to the previous state."""
+        if self.tracer is not None:
+            self.tracer.instant(
+                "revert", search_depth=len(self._intermediate_state), niter=self.niter
+            )
         # Revert the previous state
         self._intermediate_state.pop(self.niter)
         self.niter = list(self._intermediate_state)[-1]
-        self.board = self._intermediate_state[self.niter]["board"]
+        # Work on a copy, so that the stored state stays as it is if we need to
+        # come back to it again.
+        self.board = copy.copy(self._intermediate_state[self.niter]["board"])
         # Counter adding niter with 1 so that we can get back to
         # the same _intermediate_state.
         self.niter -= 1
@@ -287,29 +629,8 @@ class Board:
 
     def display(self):
         """Display the Sudoku board."""
-        print("#" * 37)
-        for ii in range(3):
-            rows = self.board[(ii * 3) : ((ii + 1) * 3)]
-            for jj, row in enumerate(rows):
-                self._print_one_row(row)
-                if jj < 2:
-                    print("#" + ("-" * 11 + "#") * 3)
-            print("#" * 37)
-
-    @staticmethod
-    def _print_one_row(row_array):
-        """Print one row of the board."""
-        b = [str(el) if el != 0 else " " for el in row_array]
-        print(
-            "#"
-            + f" {b[0]} | {b[1]} | {b[2]} "
-            + "#"
-            + f" {b[3]} | {b[4]} | {b[5]} "
-            + "#"
-            + f" {b[6]} | {b[7]} | {b[8]} "
-            + "#"
-        )
+        print(format_grid(self.board))
 
     def reset(self):
         """Reset the Sudoku problem."""
-        self.board = self.orig_board
+        self.board = self.orig_board.copy()
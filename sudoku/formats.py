@@ -0,0 +1,163 @@
+"""Read and write Sudoku boards in text formats, so that many boards can be passed
+through files and pipelines.
+
+The supported formats are:
+
+* ``"json"``: the schema of ``data/board_*.json``, i.e., an object with a ``"board"``
+  key (and optionally a ``"solution"`` key) containing a :math:`9 \\times 9` nested
+  list. A JSON list of such objects, or of :math:`9 \\times 9` nested lists, and one
+  JSON object per line are also accepted.
+* ``"line"``: one board per line, written as 81 characters row by row.
+* ``"grid"``: one board as 9 lines of 9 characters. Consecutive boards may be
+  separated by empty lines.
+
+In the text formats, empty tiles can be written as "0", ".", "_", "-", or " ", the
+same characters accepted by :class:`~sudoku.reader.UserInput`.
+"""
+
+import json
+from typing import List
+
+empty_char = ["0", ".", "_", "-", " "]  # These characters indicate that the tile is empty
+input_formats = ["auto", "json", "line", "grid"]
+output_formats = ["grid", "line", "json"]
+
+
+def _parse_chars(chars: str) -> List[int]:
+    """Convert a string of tile characters into a list of values."""
+    values = []
+    for char in chars:
+        if char in empty_char:
+            values.append(0)
+        elif char.isdigit():
+            values.append(int(char))
+        else:
+            raise ValueError(f"Invalid character {char!r} in the board")
+    return values
+
+
+def _guess_format(text: str) -> str:
+    """Guess the format of the text from its first non-empty line."""
+    stripped = text.lstrip()
+    if stripped.startswith(("{", "[")):
+        return "json"
+    first_line = stripped.splitlines()[0] if stripped else ""
+    if len(first_line.strip()) == 81:
+        return "line"
+    return "grid"
+
+
+def _parse_json(text: str) -> List[List[List[int]]]:
+    """Parse boards in JSON format."""
+    try:
+        data = json.loads(text)
+        items = data if isinstance(data, list) else [data]
+    except json.JSONDecodeError:
+        # One JSON object per line
+        items = [json.loads(line) for line in text.splitlines() if line.strip()]
+    # A single bare 9x9 nested list
+    if len(items) == 9 and all(isinstance(item, int) for item in items[0]):
+        items = [items]
+    boards = []
+    for item in items:
+        board = item["board"] if isinstance(item, dict) else item
+        boards.append([[int(val) for val in row] for row in board])
+    return boards
+
+
+def _parse_lines(text: str) -> List[List[List[int]]]:
+    """Parse boards written as 81 characters per line."""
+    boards = []
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if len(line) != 81:
+            raise ValueError(f"Each line should contain 81 characters, got {len(line)}")
+        values = _parse_chars(line)
+        boards.append([values[ii * 9 : (ii + 1) * 9] for ii in range(9)])
+    return boards
+
+
+def _parse_grids(text: str) -> List[List[List[int]]]:
+    """Parse boards written as 9 lines of 9 characters."""
+    boards = []
+    rows = []
+    for line in text.splitlines():
+        line = line.rstrip("\r\n")
+        if not line.strip() and len(line) != 9:
+            continue  # Separator between boards
+        if len(line) != 9:
+            raise ValueError(f"Each row should contain 9 characters, got {len(line)}")
+        rows.append(_parse_chars(line))
+        if len(rows) == 9:
+            boards.append(rows)
+            rows = []
+    if rows:
+        raise ValueError("The last board has fewer than 9 rows")
+    return boards
+
+
+def parse_boards(text: str, fmt: str = "auto") -> List[List[List[int]]]:
+    """Parse all boards in a text.
+
+    Parameters
+    ----------
+    text: str
+        The text containing the boards.
+    fmt: str {"auto", "json", "line", "grid"}
+        The format of the text. With ``"auto"``, the format is guessed from the
+        content.
+
+    Returns
+    -------
+    list
+        A list of boards, each is a :math:`9 \\times 9` nested list of integers.
+    """
+    assert fmt in input_formats, f"Input format should be one of {input_formats}"
+    if fmt == "auto":
+        fmt = _guess_format(text)
+    if fmt == "json":
+        return _parse_json(text)
+    elif fmt == "line":
+        return _parse_lines(text)
+    else:
+        return _parse_grids(text)
+
+
+def format_grid(board) -> str:
+    """Format a board as the grid drawn by :meth:`~sudoku.Board.display`."""
+    separator = "#" + ("-" * 11 + "#") * 3
+    lines = ["#" * 37]
+    for ii in range(3):
+        rows = board[(ii * 3) : ((ii + 1) * 3)]
+        for jj, row in enumerate(rows):
+            b = [str(el) if el != 0 else " " for el in row]
+            lines.append(
+                "#"
+                + f" {b[0]} | {b[1]} | {b[2]} "
+                + "#"
+                + f" {b[3]} | {b[4]} | {b[5]} "
+                + "#"
+                + f" {b[6]} | {b[7]} | {b[8]} "
+                + "#"
+            )
+            if jj < 2:
+                lines.append(separator)
+        lines.append("#" * 37)
+    return "\n".join(lines)
+
+
+def format_line(board) -> str:
+    """Format a board as a string of 81 characters, with "0" for empty tiles."""
+    return "".join(str(int(val)) for row in board for val in row)
+
+
+def format_json(problem, solution=None) -> str:
+    """Format a board as a single-line JSON object with the schema of
+    ``data/board_*.json``.
+    """
+    data = {"board": [[int(val) for val in row] for row in problem]}
+    if solution is not None:
+        data.update({"solution": [[int(val) for val in row] for row in solution]})
+    return json.dumps(data)
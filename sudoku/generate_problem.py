@@ -2,17 +2,35 @@
 are zero) randomly with random numbers between 1 to 9 (inclusive) and solving the problem.
 Then, values in the solved board are randomly removed. In this way, the generated board
 will be (more likely to be) solvable.
+
+The random numbers are drawn from a :class:`numpy.random.Generator` that is passed to
+each step, instead of the global ``np.random`` state, so that a seed gives the same
+problem, and so that the processes of :func:`generate_problems` don't share a state.
+Without a seed, the seed is drawn from the global ``np.random`` state, so that
+``np.random.seed`` still makes the generation reproducible.
+
+With ``minimal=True``, the clues are instead removed one at a time, and a removal is
+only kept if the problem still has a unique solution. This gives minimal problems, from
+which no clue can be removed, with typically 22 to 27 clues, or a few more when the
+clues are removed in a symmetric pattern.
 """
 
 from copy import deepcopy
+import multiprocessing as mp
+from typing import Dict, Iterator, List, Optional, Tuple
 import numpy as np
-from .board import Board
-from .utils import _blockPrint, _enablePrint
+from .solver import ALL_VALUES, PEERS, solve_board
+from .solver import _iter_solutions, _place, _to_cells
 
 
-def _create_initial_board() -> np.ndarray:
+def _create_initial_board(rng: np.random.Generator) -> np.ndarray:
     """Create an initial board to solve by populating randomly populating an empty board.
 
+    Parameters
+    ----------
+    rng: np.random.Generator
+        The random number generator.
+
     Returns
     -------
     np.ndarray
@@ -20,47 +38,49 @@ def _create_initial_board() -> np.ndarray:
     """
     nums = np.arange(1, 10)  # These are possible numbers in the board
     # Initialize empty board
-    board_init = np.zeros((9, 9), dtype=int)
+    board_init = np.zeros((9, 9), dtype=np.uint8)
     # Populate row 0
-    board_init[0] = np.random.permutation(nums)
+    board_init[0] = rng.permutation(nums)
     # Populate block 0
     possible_nums = list(set(nums) - set(board_init[0, :3]))
-    board_init[1:3, :3] = np.random.permutation(possible_nums).reshape(2, 3)
+    board_init[1:3, :3] = rng.permutation(possible_nums).reshape(2, 3)
     # Populate column 0
     possible_nums = list(set(nums) - set(board_init[:3, 0]))
-    board_init[3:, 0] = np.random.permutation(possible_nums)
+    board_init[3:, 0] = rng.permutation(possible_nums)
     # Populate block 4
     possible_nums = set(nums) - set(board_init[0, 3:6]) - set(board_init[3:6, 0])
     possible_nums = np.append(
-        np.zeros(9 - len(possible_nums), dtype=int), list(possible_nums)
+        np.zeros(9 - len(possible_nums), dtype=np.uint8), list(possible_nums)
     )  # Zeros padding
-    board_init[3:6, 3:6] = np.random.permutation(possible_nums).reshape(3, 3)
+    board_init[3:6, 3:6] = rng.permutation(possible_nums).reshape(3, 3)
     # Populate block 8
     possible_nums = set(nums) - set(board_init[0, 6:]) - set(board_init[6:, 0])
     possible_nums = np.append(
-        np.zeros(9 - len(possible_nums), dtype=int), list(possible_nums)
+        np.zeros(9 - len(possible_nums), dtype=np.uint8), list(possible_nums)
     )  # Zeros padding
-    board_init[6:, 6:] = np.random.permutation(possible_nums).reshape(3, 3)
+    board_init[6:, 6:] = rng.permutation(possible_nums).reshape(3, 3)
 
     return board_init
 
 
-def _solve_board(board: np.ndarray) -> np.ndarray:
-    """Solve the board.
+def _solve_board(board: np.ndarray) -> Optional[np.ndarray]:
+    """Solve the board with the pure-Python solver, which is much faster than
+    :class:`~sudoku.Board` on a mostly empty board.
 
     Returns
     -------
     np.ndarray
-        A solved board.
+        A solved board, or None if the randomly populated board has no solution.
     """
-    # Solve the generated board
-    B = Board(deepcopy(board))
-    B.solve()
-    board_solved = B.board
-    return board_solved
+    solution = solve_board(board)
+    if solution is None:
+        return None
+    return np.array(solution, dtype=np.uint8)
 
 
-def _remove_elements(board: np.ndarray, nremove: int) -> np.ndarray:
+def _remove_elements(
+    board: np.ndarray, nremove: int, rng: np.random.Generator
+) -> np.ndarray:
     """Randomly remove elements from a solved board.
 
     Parameters
@@ -69,6 +89,8 @@ def _remove_elements(board: np.ndarray, nremove: int) -> np.ndarray:
         An array representing a solved board.
     nremove: int
         Number of tiles to remove.
+    rng: np.random.Generator
+        The random number generator.
 
     Returns
     -------
@@ -81,7 +103,7 @@ def _remove_elements(board: np.ndarray, nremove: int) -> np.ndarray:
     board_problem = deepcopy(board)
     ii = 0
     while ii < nremove:
-        row, col = np.random.randint(0, 9, 2)
+        row, col = rng.integers(0, 9, 2)
         if board_problem[row, col] != 0:
             board_problem[row, col] = 0
             ii += 1
@@ -90,7 +112,108 @@ def _remove_elements(board: np.ndarray, nremove: int) -> np.ndarray:
     return board_problem
 
 
-def _get_ntiles_to_remove(level: int) -> int:
+# Patterns of the tiles removed together when digging a minimal problem
+symmetries = ["none", "rotational", "mirror"]
+
+
+def _symmetric_tiles(tile: int, symmetry: str) -> List[int]:
+    """The tiles that are removed together with a tile, including the tile itself.
+    ``"rotational"`` pairs the tiles that map onto each other by a 180 degree rotation
+    of the board, and ``"mirror"`` pairs the tiles that map onto each other by a
+    left-right reflection.
+    """
+    if symmetry == "rotational":
+        other = 80 - tile
+    elif symmetry == "mirror":
+        other = 9 * (tile // 9) + 8 - tile % 9
+    else:
+        other = tile
+    return [tile] if other == tile else [tile, other]
+
+
+def _update_candidates(cells: List[int], cands: List[int], tiles: List[int]):
+    """Recompute the possible values of the given tiles and their peers, which are the
+    only tiles affected when the tiles are cleared or filled.
+    """
+    for tile in set(tiles).union(*(PEERS[tl] for tl in tiles)):
+        if cells[tile]:
+            cands[tile] = 0
+        else:
+            mask = ALL_VALUES
+            for peer in PEERS[tile]:
+                mask &= ~(1 << cells[peer])
+            cands[tile] = mask
+
+
+def _has_other_solution(
+    cells: List[int], cands: List[int], tiles: List[int], solution: List[int]
+) -> bool:
+    """Check if the problem has a solution other than the known one, after the given
+    tiles are cleared from a problem whose only solution is the known one.
+
+    Any other solution differs from the known one in one of the cleared tiles. Thus,
+    instead of counting the solutions, the search looks for a single solution in which
+    the first cleared tile has another value, then one in which the first tile has its
+    known value and the second tile has another value, and so on.
+    """
+    for ii, tile in enumerate(tiles):
+        new_cells = list(cells)
+        new_cands = list(cands)
+        for prev in tiles[:ii]:
+            _place(new_cells, new_cands, prev, solution[prev])
+        new_cands[tile] &= ~(1 << solution[tile])
+        if next(_iter_solutions(new_cells, new_cands), None) is not None:
+            return True
+    return False
+
+
+def _dig_minimal(
+    board: np.ndarray, symmetry: str, rng: np.random.Generator
+) -> np.ndarray:
+    """Remove the clues of a solved board one at a time, in a random order, keeping a
+    removal only if the problem still has a unique solution.
+
+    The possible values of the tiles are kept from one removal to the next, and only
+    updated around the removed tiles. Removing clues never removes solutions, so a clue
+    that can't be removed at some point can't be removed later either. Hence, each tile
+    is only tried once, and the resulting problem is minimal.
+
+    Parameters
+    ----------
+    board: np.ndarray
+        An array representing a solved board.
+    symmetry: str {"none", "rotational", "mirror"}
+        Pattern of the tiles removed together.
+    rng: np.random.Generator
+        The random number generator.
+
+    Returns
+    -------
+    np.ndarray
+        A problem with a unique solution, from which no clue, or pair of symmetric
+        clues, can be removed.
+    """
+    solution = _to_cells(board)
+    cells = list(solution)
+    cands = [0] * 81
+    tried = [False] * 81
+    for tile in rng.permutation(81):
+        if tried[tile]:
+            continue
+        tiles = _symmetric_tiles(int(tile), symmetry)
+        for tl in tiles:
+            tried[tl] = True
+            cells[tl] = 0
+        _update_candidates(cells, cands, tiles)
+        if _has_other_solution(cells, cands, tiles, solution):
+            # Put the clues back
+            for tl in tiles:
+                cells[tl] = solution[tl]
+            _update_candidates(cells, cands, tiles)
+    return np.array(cells, dtype=np.uint8).reshape(9, 9)
+
+
+def _get_ntiles_to_remove(level: int, rng: np.random.Generator) -> int:
     """Get the number of tiles to remove, given the level of problem requested.
 
     Here, we decide on the maximum and minimum number of tiles to retain in the board,
@@ -103,6 +226,8 @@ def _get_ntiles_to_remove(level: int) -> int:
     ----------
     level: int range(1, 5)
         Requested level of difficulty. Lower number means easier level of difficulty.
+    rng: np.random.Generator
+        The random number generator.
 
     Returns
     -------
@@ -125,11 +250,13 @@ def _get_ntiles_to_remove(level: int) -> int:
     ]
     # Given level, we randomly select the number of tiles to remove
     lb, ub = bins[level - 1]
-    nremove = np.random.randint(lb, ub)
+    nremove = rng.integers(lb, ub)
     return nremove
 
 
-def generate_problem(level: int = 3) -> np.ndarray:
+def generate_problem(
+    level: int = 3, seed=None, minimal: bool = False, symmetry: str = "none"
+) -> np.ndarray:
     """Main function to generate a Sudoku problem board.
 
     To generate the problem board, we first solve a randomly generated Sudoku board, then
@@ -139,6 +266,15 @@ def generate_problem(level: int = 3) -> np.ndarray:
     ----------
     level: int range(1, 5)
         Requested level of difficulty. Lower number means easier level of difficulty.
+    seed: {None, int, np.random.SeedSequence, np.random.Generator}
+        Seed of the random number generator, see ``np.random.default_rng``. The same
+        seed gives the same problem. With None, the seed is drawn from the global
+        ``np.random`` state.
+    minimal: bool
+        Remove clues as long as the problem has a unique solution, which gives a
+        minimal problem. The level is then ignored.
+    symmetry: str {"none", "rotational", "mirror"}
+        With ``minimal=True``, pattern of the clues, see :func:`_symmetric_tiles`.
 
     Returns
     -------
@@ -147,19 +283,101 @@ def generate_problem(level: int = 3) -> np.ndarray:
     """
     assert isinstance(level, int), "Difficulty level can only be an integer number"
     assert 1 <= level <= 5, "Difficulty level ranges from 1 to 5 only"
-    while True:
-        try:
-            _blockPrint()
-            # Initially, randomly populate en empty board
-            board_init = _create_initial_board()
-            # Solve this initial board
-            board_solved = _solve_board(board_init)
-            # Randomly remove elements from the solved board
-            nremove = _get_ntiles_to_remove(level)
-            board_problem = _remove_elements(board_solved, nremove)
-            _enablePrint()
-            break
-        except IndexError:
-            pass
+    assert symmetry in symmetries, f"symmetry should be one of {symmetries}"
+    if seed is None:
+        seed = _global_seed()
+    rng = np.random.default_rng(seed)
+    board_solved = None
+    while board_solved is None:
+        # Initially, randomly populate en empty board
+        board_init = _create_initial_board(rng)
+        # Solve this initial board
+        board_solved = _solve_board(board_init)
 
+    if minimal:
+        # Remove elements while the solution stays unique
+        return _dig_minimal(board_solved, symmetry, rng)
+    # Randomly remove elements from the solved board
+    nremove = _get_ntiles_to_remove(level, rng)
+    board_problem = _remove_elements(board_solved, nremove, rng)
     return board_problem
+
+
+def _global_seed() -> int:
+    """Draw a seed from the global ``np.random`` state."""
+    return int(np.random.randint(2**32, dtype=np.uint64))
+
+
+def _generate_one(args: Tuple[int, np.random.SeedSequence, Dict]) -> np.ndarray:
+    """Generate a problem in a worker process."""
+    level, seed, kwargs = args
+    return generate_problem(level, seed, **kwargs)
+
+
+def generate_problems(
+    n: int,
+    level: int = 3,
+    seed=None,
+    workers: Optional[int] = None,
+    minimal: bool = False,
+    symmetry: str = "none",
+) -> Iterator[np.ndarray]:
+    """Generate several Sudoku problems, spread over processes.
+
+    Each problem gets its own random number generator, seeded from a child of
+    ``np.random.SeedSequence(seed)``. Thus, the problems only depend on the seed and
+    their index, and a seed gives the same problems, in the same order, for any number
+    of processes.
+
+    Parameters
+    ----------
+    n: int
+        Number of problems to generate.
+    level: int range(1, 5)
+        Requested level of difficulty. Lower number means easier level of difficulty.
+    seed: {None, int, np.random.SeedSequence}
+        Seed of the problems. A given ``SeedSequence`` is not modified, so it gives the
+        same problems at each call. With None, the seed is drawn from the global
+        ``np.random`` state.
+    workers: int
+        Number of processes. Defaults to the number of CPUs. With 1, the problems are
+        generated in the current process.
+    minimal: bool
+        Generate minimal problems, see :func:`generate_problem`.
+    symmetry: str {"none", "rotational", "mirror"}
+        With ``minimal=True``, pattern of the clues.
+
+    Yields
+    ------
+    np.ndarray
+        The generated problems, in order, as soon as each one is ready.
+    """
+    assert n >= 0, "n should be a non-negative integer"
+    assert isinstance(level, int), "Difficulty level can only be an integer number"
+    assert 1 <= level <= 5, "Difficulty level ranges from 1 to 5 only"
+    if workers is None:
+        workers = mp.cpu_count()
+    assert workers > 0, "workers should be a positive integer"
+    assert symmetry in symmetries, f"symmetry should be one of {symmetries}"
+    if seed is None:
+        seed = _global_seed()
+    if isinstance(seed, np.random.SeedSequence):
+        # Spawning advances the given sequence, so spawn from a copy
+        seed = np.random.SeedSequence(seed.entropy, spawn_key=seed.spawn_key)
+    else:
+        seed = np.random.SeedSequence(seed)
+    kwargs = {"minimal": minimal, "symmetry": symmetry}
+    tasks = [(level, child, kwargs) for child in seed.spawn(n)]
+
+    if workers == 1 or n <= 1:
+        for task in tasks:
+            yield _generate_one(task)
+        return
+
+    pool = mp.Pool(min(workers, n))
+    try:
+        yield from pool.imap(_generate_one, tasks)
+    finally:
+        # Stop the processes if the consumer stops early
+        pool.terminate()
+        pool.join()
@@ -1,11 +1,134 @@
 import argparse
+import json
+import os
+import sys
+import time
 
-from .reader import UserInput
-from .board import Board
+from .solver import solve_board, _to_cells
+from .formats import _guess_format
+from .formats import (
+    parse_boards,
+    format_grid,
+    format_line,
+    format_json,
+    input_formats,
+    output_formats,
+)
+
+
+def _split_input(text, input_format):
+    """Split the text into the parts that are parsed separately, with their line
+    numbers. In the line format and for one JSON object per line, each line is a part,
+    so that a malformed line doesn't prevent the other boards from being solved.
+    """
+    fmt = _guess_format(text) if input_format == "auto" else input_format
+    lines = [(nn, line) for nn, line in enumerate(text.splitlines(), 1) if line.strip()]
+    if fmt == "line":
+        return lines, fmt
+    if fmt == "json" and len(lines) > 1:
+        try:
+            json.loads(lines[0][1])
+            return lines, fmt
+        except json.JSONDecodeError:
+            pass  # A JSON document over several lines
+    return [(None, text)], fmt
+
+
+def _read_inputs(inputs, input_format):
+    """Iterate over the problems in the inputs. Each input is a file path, "-" for the
+    standard input, or a board written inline as 81 characters.
+
+    Yields
+    ------
+    source: str
+        Where the problem comes from, used in the messages.
+    problem: list
+        The problem, or None if it can't be parsed or isn't a valid board.
+    error: str
+        Why the problem can't be used, or None.
+    """
+    for kk, item in enumerate(inputs, 1):
+        inline = False
+        if item == "-":
+            source = "<stdin>"
+            text = sys.stdin.read()
+        elif os.path.isfile(item):
+            source = item
+            with open(item, "r") as f:
+                text = f.read()
+        elif len(item.strip()) == 81:
+            source = f"argument {kk}"
+            text = item
+            inline = True
+        else:
+            yield item, None, "neither an existing file nor a board of 81 characters"
+            continue
+        parts, fmt = _split_input(text, input_format)
+        if inline:
+            parts = [(None, text)]
+        for nn, part in parts:
+            part_source = source if nn is None else f"{source}, line {nn}"
+            try:
+                boards = parse_boards(part, fmt)
+            except (KeyError, TypeError, ValueError) as err:
+                yield part_source, None, str(err)
+                continue
+            for bb, board in enumerate(boards, 1):
+                board_source = part_source
+                if len(boards) > 1:
+                    board_source = f"{part_source}, board {bb}"
+                try:
+                    _to_cells(board)
+                except (TypeError, ValueError, AssertionError) as err:
+                    yield board_source, None, str(err)
+                    continue
+                yield board_source, board, None
+
+
+def _print_result(problem, solution, args):
+    """Print the solution in the requested output format."""
+    if args.output_format == "grid":
+        if args.show_init:
+            print()
+            print("Problem:")
+            print(format_grid(problem))
+            print()
+        print("Solution:")
+        print(format_grid(solution))
+    elif args.output_format == "line":
+        if args.show_init:
+            print(format_line(problem))
+        print(format_line(solution))
+    else:
+        print(format_json(problem, solution))
+
+
+def _print_timing(timings, nsolved, nboards):
+    """Print the summary of the solving time to the standard error. The boards that
+    can't be parsed count in ``nboards`` but have no solving time.
+    """
+    if not timings:
+        return
+    total = sum(timings)
+    print(
+        f"Solved {nsolved}/{nboards} boards in {total:.6f} s "
+        f"(mean {total / len(timings):.6f} s, min {min(timings):.6f} s, "
+        f"max {max(timings):.6f} s)",
+        file=sys.stderr,
+    )
 
 
 def main(argv=None):
     arg_parser = argparse.ArgumentParser(description="Sudoku solver command line tool")
+    arg_parser.add_argument(
+        "inputs",
+        nargs="*",
+        help=(
+            "Files containing the boards, '-' for the standard input, or boards "
+            "written as 81 characters. If no input is given, the boards are read "
+            "from the standard input, or interactively if it is a terminal."
+        ),
+    )
     arg_parser.add_argument(
         "-s",
         "--show-init",
@@ -20,16 +143,97 @@ def main(argv=None):
         action="store_true",
         help="Show the steps of the solving process",
     )
+    arg_parser.add_argument(
+        "-f",
+        "--input-format",
+        dest="input_format",
+        choices=input_formats,
+        default="auto",
+        help="Format of the input boards",
+    )
+    arg_parser.add_argument(
+        "-o",
+        "--output-format",
+        dest="output_format",
+        choices=output_formats,
+        default="grid",
+        help="Format of the printed solutions",
+    )
+    arg_parser.add_argument(
+        "-t",
+        "--timing",
+        dest="timing",
+        action="store_true",
+        help="Print the solving time of each board and a summary to standard error",
+    )
+    arg_parser.add_argument(
+        "--trace",
+        dest="trace",
+        help=(
+            "Record the phases of the solving process of Board.solve and write them "
+            "to this file"
+        ),
+    )
+    arg_parser.add_argument(
+        "--trace-format",
+        dest="trace_format",
+        choices=["chrome", "folded"],
+        default="chrome",
+        help="Write the trace in the Chrome trace event format or as folded stacks",
+    )
     args = arg_parser.parse_args(argv)
 
-    board_input = UserInput()
-    board = Board(board_input.board)
-    if args.show_init:
-        print()
-        print("Problem:")
-        board.display()
-        print()
-
-    board.solve(verbose=args.verbose)
-    print("Solution:")
-    board.display()
+    tracer = None
+    if args.trace:
+        from .trace import Tracer
+
+        tracer = Tracer()
+
+    if not args.inputs and sys.stdin.isatty():
+        # Interactive mode
+        from .reader import UserInput
+
+        board_input = UserInput()
+        problems = [("<stdin>", board_input.board, None)]
+    else:
+        problems = _read_inputs(args.inputs or ["-"], args.input_format)
+
+    timings = []
+    nsolved = 0
+    nfailed = 0
+    for source, problem, error in problems:
+        if error is not None:
+            nfailed += 1
+            print(f"{source}: {error}", file=sys.stderr)
+            continue
+        start_time = time.perf_counter()
+        # The pure-Python solver doesn't need NumPy. The steps of the solving process
+        # and the trace are only available from the Board class, which doesn't stop
+        # on a problem without solution, so the problem is checked first. Only the
+        # solve that gives the printed solution is timed.
+        solution = solve_board(problem)
+        if (args.verbose or tracer is not None) and solution is not None:
+            from .board import Board
+
+            start_time = time.perf_counter()
+            board = Board(problem)
+            board.solve(verbose=args.verbose, tracer=tracer)
+            solution = board.board
+        timings.append(time.perf_counter() - start_time)
+        if args.timing:
+            print(f"{source}: {timings[-1]:.6f} s", file=sys.stderr)
+        if solution is not None:
+            nsolved += 1
+            _print_result(problem, solution, args)
+        else:
+            nfailed += 1
+            print(f"{source}: no solution", file=sys.stderr)
+
+    if args.timing:
+        _print_timing(timings, nsolved, nsolved + nfailed)
+    if tracer is not None:
+        if args.trace_format == "chrome":
+            tracer.write_chrome_trace(args.trace)
+        else:
+            tracer.write_folded(args.trace)
+    return 1 if nfailed else 0
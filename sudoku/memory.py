@@ -0,0 +1,96 @@
+"""Measure the memory used by solving and generating Sudoku problems.
+
+The measurement uses :mod:`tracemalloc`, which traces the memory blocks allocated by
+Python. For a function that is called repeatedly, :func:`measure_memory` reports the
+peak of the traced memory while the function runs, and the memory that is still
+allocated after the calls, which reveals the state that the function keeps or leaks.
+:func:`check_budget` compares such a report with a budget, so that memory regressions
+can be caught by a benchmark or a test.
+"""
+
+import gc
+import tracemalloc
+from typing import Callable, Dict, List
+
+# Exclude the snapshots taken by tracemalloc from the measurement
+_filters = [tracemalloc.Filter(False, tracemalloc.__file__)]
+
+
+def measure_memory(func: Callable, nrepeat: int = 1, warmup: bool = True) -> Dict:
+    """Measure the memory used by calling a function repeatedly.
+
+    Parameters
+    ----------
+    func: callable
+        The function to measure, called without arguments.
+    nrepeat: int
+        Number of times to call the function.
+    warmup: bool
+        Call the function once before the measurement, so that the lazy imports and
+        the caches filled on the first call are not counted.
+
+    Returns
+    -------
+    dict
+        The report, with the keys:
+
+        * ``"nrepeat"``: number of calls.
+        * ``"peak_bytes"``: peak of the traced memory during the calls, above the
+          memory traced before the calls.
+        * ``"retained_bytes"``: memory allocated during the calls that is still
+          allocated after them, after a garbage collection.
+        * ``"retained_blocks"``: number of memory blocks behind ``retained_bytes``,
+          i.e., the blocks still allocated after the calls. This is not the number of
+          allocations made during the calls, most of which are freed.
+    """
+    assert nrepeat > 0, "nrepeat should be a positive integer"
+    if warmup:
+        func()
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        gc.collect()
+        before = tracemalloc.take_snapshot().filter_traces(_filters)
+        base, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        for _ in range(nrepeat):
+            func()
+        _, peak = tracemalloc.get_traced_memory()
+        gc.collect()
+        after = tracemalloc.take_snapshot().filter_traces(_filters)
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+    stats = after.compare_to(before, "filename")
+    return {
+        "nrepeat": nrepeat,
+        "peak_bytes": peak - base,
+        "retained_bytes": sum(stat.size_diff for stat in stats),
+        "retained_blocks": sum(stat.count_diff for stat in stats),
+    }
+
+
+def check_budget(report: Dict, budget: Dict) -> List[str]:
+    """Compare a report of :func:`measure_memory` with a budget.
+
+    Parameters
+    ----------
+    report: dict
+        The report of :func:`measure_memory`.
+    budget: dict
+        The maximum value allowed for some of the keys in the report, e.g.,
+        ``{"peak_bytes": 1024 * 1024}``.
+
+    Returns
+    -------
+    list
+        A message for each value that exceeds the budget. The list is empty if the
+        report is within the budget.
+    """
+    violations = []
+    for key, limit in budget.items():
+        if report[key] > limit:
+            violations.append(f"{key} = {report[key]} exceeds the budget of {limit}")
+    return violations
@@ -0,0 +1,120 @@
+"""Solve a single hard Sudoku problem with several processes.
+
+The search tree is split near its root: the first guesses of the search (a tile and a
+value) are expanded breadth-first until there are several times more independent
+subproblems than processes. The subproblems are then solved by a process pool, where an
+idle process takes the next subproblem from a shared queue. Since there are more
+subproblems than processes, a process that finishes a small subtree early takes over
+the remaining work instead of waiting. The pool is stopped as soon as one subproblem
+gives a solution.
+
+Starting the processes costs more than solving a typical problem, so this is only
+worth it for problems whose search takes a long time.
+"""
+
+import multiprocessing as mp
+import random
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .solver import _check_options, _initial_candidates, _iter_solutions
+from .solver import _order_values, _pick_tile, _place, _propagate, _to_board, _to_cells
+
+
+def _split(
+    cells: List[int], cands: List[int], nsplit: int, config: Dict
+) -> Tuple[Optional[List[int]], List[List[int]]]:
+    """Expand the search tree breadth-first until there are at least ``nsplit``
+    subproblems.
+
+    Returns
+    -------
+    solution: list
+        A solution, if one is found while expanding the tree.
+    subproblems: list
+        The boards of the subproblems, in the order the search would visit them.
+    """
+    propagation = config.get("propagation", "full")
+    value_order = config.get("value_order", "ascending")
+    rng = random.Random(config.get("seed"))
+    if not _propagate(cells, cands, propagation):
+        return None, []
+    frontier = [(cells, cands)]
+    while 0 < len(frontier) < nsplit:
+        expanded = []
+        for cells, cands in frontier:
+            tile = _pick_tile(cells, cands, config.get("tile_order", "mrv"))
+            if tile < 0:
+                return cells, []
+            for val in _order_values(cells, cands, tile, value_order, rng):
+                new_cells = list(cells)
+                new_cands = list(cands)
+                _place(new_cells, new_cands, tile, val)
+                if _propagate(new_cells, new_cands, propagation):
+                    expanded.append((new_cells, new_cands))
+        frontier = expanded
+    return None, [cells for cells, _ in frontier]
+
+
+def _solve_subproblem(args: Tuple[List[int], Dict]) -> Optional[List[int]]:
+    """Search one subproblem. The possible values are recomputed from the board, which
+    is cheaper to send to the process.
+    """
+    cells, config = args
+    cands = _initial_candidates(cells)
+    return next(_iter_solutions(cells, cands, **config), None)
+
+
+def solve_parallel(
+    board: Sequence[Sequence[int]],
+    workers: Optional[int] = None,
+    nsplit: Optional[int] = None,
+    **config,
+) -> Optional[List[List[int]]]:
+    """Solve a Sudoku problem by splitting its search tree over a process pool.
+
+    Parameters
+    ----------
+    board: array-like (9, 9,)
+        The Sudoku problem, where the value of zero means that the tile is empty.
+    workers: int
+        Number of processes. Defaults to the number of CPUs.
+    nsplit: int
+        Minimum number of subproblems to split the search tree into. Defaults to 8
+        subproblems per process.
+    config
+        Options to configure the search, see :func:`~sudoku.solver.solve_board`.
+
+    Returns
+    -------
+    list
+        The solved board as a :math:`9 \\times 9` nested list, or None if the problem
+        has no solution.
+    """
+    if workers is None:
+        workers = mp.cpu_count()
+    if nsplit is None:
+        nsplit = 8 * workers
+    assert workers > 0, "workers should be a positive integer"
+    cells = _to_cells(board)
+    cands = _initial_candidates(cells)
+    if cands is None:
+        return None
+    _check_options(**config)
+
+    solution, subproblems = _split(cells, cands, nsplit, config)
+    if solution is not None:
+        return _to_board(solution)
+    if not subproblems:
+        return None
+
+    pool = mp.Pool(min(workers, len(subproblems)))
+    try:
+        tasks = [(subproblem, config) for subproblem in subproblems]
+        for solution in pool.imap_unordered(_solve_subproblem, tasks, chunksize=1):
+            if solution is not None:
+                return _to_board(solution)
+    finally:
+        # Stop the processes that are still searching
+        pool.terminate()
+        pool.join()
+    return None
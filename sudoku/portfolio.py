@@ -0,0 +1,121 @@
+"""Solve a Sudoku problem by racing differently configured searches.
+
+The time to solve a problem depends a lot on the order in which the tiles and values are
+guessed, and an order that is fast on one problem can be slow on another. A portfolio
+starts several searches, each with different options of
+:func:`~sudoku.solver.solve_board`, in parallel processes. The first search that
+finishes gives the result, and the other searches are stopped. This cuts the time spent
+on the problems that are unlucky for a single configuration.
+"""
+
+import multiprocessing as mp
+import queue
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .solver import solve_board, _check_options, _initial_candidates, _to_board
+from .solver import _to_cells
+
+# Interval, in seconds, at which the processes are checked while waiting for a result
+_poll_interval = 0.1
+
+# A default portfolio, with configurations that tend to be fast on different problems
+default_portfolio = [
+    {"tile_order": "mrv", "value_order": "ascending", "propagation": "full"},
+    {"tile_order": "mrv", "value_order": "descending", "propagation": "full"},
+    {"tile_order": "mrv_reverse", "value_order": "ascending", "propagation": "full"},
+    {"tile_order": "static", "value_order": "ascending", "propagation": "naked"},
+]
+
+
+def _run_config(index: int, board: List[List[int]], config: Dict, results: mp.Queue):
+    """Solve the board with one configuration and report the result, or the exception
+    raised by the search.
+    """
+    try:
+        results.put((index, solve_board(board, **config), None))
+    except Exception as err:
+        results.put((index, None, err))
+
+
+def _wait_result(
+    results: mp.Queue, processes: List[mp.Process], timeout: Optional[float]
+) -> Tuple[int, Optional[List[List[int]]], Optional[Exception]]:
+    """Wait for the first result, checking that some process is still running."""
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while True:
+        wait = _poll_interval
+        if deadline is not None:
+            wait = min(wait, deadline - time.monotonic())
+            if wait <= 0:
+                raise TimeoutError(f"No configuration finishes in {timeout} seconds")
+        try:
+            return results.get(timeout=wait)
+        except queue.Empty:
+            pass
+        if not any(process.is_alive() for process in processes):
+            # A result may have been sent just before the last process exited
+            try:
+                return results.get(timeout=_poll_interval)
+            except queue.Empty:
+                raise RuntimeError("All configurations stopped without a result")
+
+
+def solve_portfolio(
+    board: Sequence[Sequence[int]],
+    portfolio: Optional[List[Dict]] = None,
+    timeout: Optional[float] = None,
+) -> Tuple[Optional[List[List[int]]], Dict]:
+    """Solve a Sudoku problem with several configurations in parallel processes, and
+    return the result of the first one that finishes.
+
+    Parameters
+    ----------
+    board: array-like (9, 9,)
+        The Sudoku problem, where the value of zero means that the tile is empty.
+    portfolio: list
+        A list of configurations. Each configuration is a dictionary of options passed
+        to :func:`~sudoku.solver.solve_board`. Defaults to ``default_portfolio``.
+    timeout: float
+        Maximum time, in seconds, to wait for a result. :class:`TimeoutError` is raised
+        if no search finishes in time.
+
+    Returns
+    -------
+    solution: list
+        The solved board as a :math:`9 \\times 9` nested list, or None if the problem
+        has no solution.
+    config: dict
+        The configuration that finished first, or None if the problem has a repeated
+        value, which is found before any search starts.
+    """
+    if portfolio is None:
+        portfolio = default_portfolio
+    assert len(portfolio) > 0, "The portfolio should contain at least 1 configuration"
+    for config in portfolio:
+        _check_options(**config)
+    # Check the board here, since an error in a process would only stop that process
+    cells = _to_cells(board)
+    if _initial_candidates(cells) is None:
+        return None, None
+    board = _to_board(cells)
+
+    results = mp.Queue()
+    processes = [
+        mp.Process(target=_run_config, args=(ii, board, config, results), daemon=True)
+        for ii, config in enumerate(portfolio)
+    ]
+    for process in processes:
+        process.start()
+    try:
+        index, solution, error = _wait_result(results, processes, timeout)
+    finally:
+        # Stop the searches that are still running
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        for process in processes:
+            process.join()
+    if error is not None:
+        raise error
+    return solution, portfolio[index]
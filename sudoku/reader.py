@@ -22,7 +22,7 @@ class UserInput:
 
     def __init__(self):
         print("Input each row of the board below:")
-        self.board = np.zeros((9, 9), dtype=int)
+        self.board = np.zeros((9, 9), dtype=np.uint8)
         for ii in range(9):  # There are 9 rows
             self.board[ii] = self.request_line()
 
@@ -0,0 +1,168 @@
+"""Incremental state of an interactive Sudoku game.
+
+When a player sets or clears a tile, only the tiles in the same row, column, and block
+(the peers) are affected. :class:`PlaySession` keeps the board, how many times each
+value appears in each row, column, and block, and the bitmask of possible values of
+each tile, and updates them only for the changed tile and its peers. This makes checking
+the board, highlighting conflicts, and giving hints cheap after each move, instead of
+rescanning the whole board.
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .solver import ALL_VALUES, NBITS, PEERS, TILE_UNITS, UNITS, solve_board
+from .solver import _to_cells, _mask_values
+
+
+class PlaySession:
+    """The state of a Sudoku game played by a user.
+
+    Parameters
+    ----------
+    problem: array-like (9, 9,)
+        The Sudoku problem, where the value of zero means that the tile is empty. The
+        tiles filled in the problem can't be changed by the player.
+
+    Attributes
+    ----------
+    cells: list
+        The current values of the 81 tiles, row by row.
+    solution: list
+        The solution of the problem as a flat list, or None if the problem has no
+        solution. It is only used to give hints.
+    """
+
+    def __init__(self, problem: Sequence[Sequence[int]]):
+        self.cells = _to_cells(problem)
+        self.fixed = [bool(val) for val in self.cells]
+        solution = solve_board(problem)
+        self.solution = None if solution is None else _to_cells(solution)
+
+        # Number of times each value appears in each unit, and the bitmask of the
+        # values that appear in each unit
+        self._counts = [[0] * 10 for _ in UNITS]
+        self._used = [0] * len(UNITS)
+        for tile, val in enumerate(self.cells):
+            if val:
+                for uu in TILE_UNITS[tile]:
+                    self._counts[uu][val] += 1
+                    self._used[uu] |= 1 << val
+        self._cands = [self._compute_candidates(tile) for tile in range(81)]
+        self._conflicts = {tile for tile in range(81) if self._in_conflict(tile)}
+        self._nempty = self.cells.count(0)
+
+    def _compute_candidates(self, tile: int) -> int:
+        """Bitmask of the values that don't appear in the row, column, and block of an
+        empty tile.
+        """
+        if self.cells[tile]:
+            return 0
+        row, column, block = TILE_UNITS[tile]
+        used = self._used
+        return ALL_VALUES & ~(used[row] | used[column] | used[block])
+
+    def _in_conflict(self, tile: int) -> bool:
+        """Check if the value of the tile is repeated in its row, column, or block."""
+        val = self.cells[tile]
+        return bool(val) and any(self._counts[uu][val] > 1 for uu in TILE_UNITS[tile])
+
+    def set_value(self, row: int, column: int, value: int) -> List[Tuple[int, int]]:
+        """Set the value of a tile, where the value of zero clears the tile.
+
+        Returns
+        -------
+        list
+            The positions of the tiles whose conflict status changed.
+        """
+        assert 0 <= row < 9 and 0 <= column < 9, "The tile should be in the 9x9 board"
+        assert 0 <= value <= 9, "The value should be between 0 and 9"
+        tile = 9 * row + column
+        if self.fixed[tile]:
+            raise ValueError(f"Tile [{row}, {column}] is part of the problem")
+        old = self.cells[tile]
+        if old == value:
+            return []
+
+        # Update the counts of the 3 units containing the tile
+        for uu in TILE_UNITS[tile]:
+            counts = self._counts[uu]
+            if old:
+                counts[old] -= 1
+                if not counts[old]:
+                    self._used[uu] &= ~(1 << old)
+            if value:
+                counts[value] += 1
+                self._used[uu] |= 1 << value
+        self.cells[tile] = value
+        self._nempty += (not value) - (not old)
+
+        # Only the tile and its peers are affected
+        changed = []
+        for tl in [tile] + PEERS[tile]:
+            self._cands[tl] = self._compute_candidates(tl)
+            conflict = self._in_conflict(tl)
+            if conflict != (tl in self._conflicts):
+                if conflict:
+                    self._conflicts.add(tl)
+                else:
+                    self._conflicts.discard(tl)
+                changed.append((tl // 9, tl % 9))
+        return changed
+
+    def candidates(self, row: int, column: int) -> List[int]:
+        """List the values that can be put in a tile without a conflict."""
+        return _mask_values(self._cands[9 * row + column])
+
+    @property
+    def conflicts(self) -> List[Tuple[int, int]]:
+        """Positions of the tiles whose values are repeated in their row, column, or
+        block.
+        """
+        return sorted((tile // 9, tile % 9) for tile in self._conflicts)
+
+    @property
+    def solved(self) -> bool:
+        """Check if the board is solved, i.e., all tiles are filled without conflict."""
+        return not self._nempty and not self._conflicts
+
+    @property
+    def board(self) -> List[List[int]]:
+        """The current board as a 9x9 nested list."""
+        return [self.cells[ii * 9 : (ii + 1) * 9] for ii in range(9)]
+
+    def hint(self) -> Optional[Dict]:
+        """Suggest the next move.
+
+        A tile filled with a wrong value is pointed out first. Otherwise, the hint is
+        the value of the empty tile with the fewest possible values, which is the
+        easiest tile to fill.
+
+        Returns
+        -------
+        dict
+            The position of the tile, the value to put in it, and whether the tile
+            currently holds a wrong value. None if the board is solved or the problem
+            has no solution.
+        """
+        if self.solution is None:
+            return None
+        best = None
+        best_n = 10
+        for tile in range(81):
+            val = self.cells[tile]
+            if val and val != self.solution[tile]:
+                best = tile
+                break
+            if not val:
+                n = NBITS[self._cands[tile]]
+                if n < best_n:
+                    best = tile
+                    best_n = n
+        if best is None:
+            return None
+        return {
+            "row": best // 9,
+            "column": best % 9,
+            "value": self.solution[best],
+            "wrong": bool(self.cells[best]),
+        }
@@ -0,0 +1,374 @@
+"""A pure-Python Sudoku solver that doesn't depend on NumPy.
+
+This is the solver used by the command line tool, where the time to import NumPy is
+larger than the time to solve a typical board. The board is stored as a flat list of 81
+values, and the possible values of each empty tile are stored as a bitmask, where bit
+``v`` is set if the value ``v`` can be put in the tile. The solver alternates between
+filling the tiles that have a single possible value, filling the values that have a
+single possible tile in a row, column, or block, and guessing the value of the empty
+tile with the fewest possible values.
+"""
+
+import random
+from typing import Iterator, List, Optional, Sequence
+
+ALL_VALUES = 0b1111111110  # Bits 1 to 9 are set
+
+# Indices of the tiles in each row, column, and block, using the flattened board
+ROWS = [[9 * row + col for col in range(9)] for row in range(9)]
+COLUMNS = [[9 * row + col for row in range(9)] for col in range(9)]
+BLOCKS = [
+    [9 * (block // 3 * 3 + x) + block % 3 * 3 + y for x in range(3) for y in range(3)]
+    for block in range(9)
+]
+UNITS = ROWS + COLUMNS + BLOCKS
+# Indices of the tiles that share a row, column, or block with each tile
+PEERS = [
+    sorted(set(idx for unit in UNITS if tile in unit for idx in unit) - {tile})
+    for tile in range(81)
+]
+# Indices of the row, column, and block of each tile, in UNITS
+TILE_UNITS = [
+    [uu for uu, unit in enumerate(UNITS) if tile in unit] for tile in range(81)
+]
+# Number of possible values in each bitmask
+NBITS = [bin(mask).count("1") for mask in range(ALL_VALUES + 1)]
+
+# Options to configure the search, see :func:`solve_board`. The same tile and value
+# orders are available in :class:`~sudoku.Board`.
+tile_orders = ["mrv", "mrv_reverse", "static", "mrv_degree", "dom_wdeg"]
+value_orders = ["ascending", "descending", "lcv", "random"]
+propagations = ["full", "naked", "none"]
+
+
+def _mask_values(mask: int) -> List[int]:
+    """List the values whose bits are set in the mask, in ascending order."""
+    return [val for val in range(1, 10) if mask >> val & 1]
+
+
+def _initial_candidates(cells: List[int]) -> Optional[List[int]]:
+    """Compute the bitmask of possible values of each tile. Filled tiles have an empty
+    mask. Returns None if a value is repeated in a row, column, or block.
+    """
+    cands = [0] * 81
+    for tile in range(81):
+        if cells[tile]:
+            for peer in PEERS[tile]:
+                if cells[peer] == cells[tile]:
+                    return None
+        else:
+            mask = ALL_VALUES
+            for peer in PEERS[tile]:
+                mask &= ~(1 << cells[peer])
+            cands[tile] = mask
+    return cands
+
+
+def _place(cells: List[int], cands: List[int], tile: int, val: int):
+    """Put a value in a tile and remove it from the possible values of the peers."""
+    cells[tile] = val
+    cands[tile] = 0
+    bit = 1 << val
+    for peer in PEERS[tile]:
+        if cands[peer] & bit:
+            cands[peer] &= ~bit
+
+
+def _propagate(
+    cells: List[int],
+    cands: List[int],
+    propagation: str = "full",
+    weights: Optional[List[int]] = None,
+) -> bool:
+    """Fill the tiles that are forced by the current possible values, until nothing
+    changes. Returns False if the board turns out to have no solution.
+
+    With ``propagation="naked"``, only the tiles that have a single possible value are
+    filled. With ``propagation="none"``, nothing is filled and the board is only checked
+    for empty tiles without possible values.
+
+    If ``weights`` is given, the weights of the rows, columns, and blocks where the
+    contradiction is found are incremented, see ``tile_order="dom_wdeg"``.
+    """
+    changed = True
+    while changed:
+        changed = False
+        # Tiles that have a single possible value
+        for tile in range(81):
+            if not cells[tile]:
+                mask = cands[tile]
+                if not mask:
+                    if weights is not None:
+                        for uu in TILE_UNITS[tile]:
+                            weights[uu] += 1
+                    return False
+                if propagation != "none" and not mask & (mask - 1):
+                    _place(cells, cands, tile, mask.bit_length() - 1)
+                    changed = True
+        if propagation != "full":
+            continue
+        # Values that have a single possible tile in a unit
+        for uu, unit in enumerate(UNITS):
+            once = 0
+            more = 0
+            filled = 0
+            for tile in unit:
+                if cells[tile]:
+                    filled |= 1 << cells[tile]
+                else:
+                    more |= once & cands[tile]
+                    once |= cands[tile]
+            if once | filled != ALL_VALUES:
+                if weights is not None:
+                    weights[uu] += 1
+                return False
+            singles = once & ~more
+            if singles:
+                for tile in unit:
+                    mask = cands[tile] & singles
+                    if mask:
+                        if mask & (mask - 1):
+                            if weights is not None:
+                                weights[uu] += 1
+                            return False
+                        _place(cells, cands, tile, mask.bit_length() - 1)
+                        changed = True
+    return True
+
+
+def _pick_tile(
+    cells: List[int],
+    cands: List[int],
+    tile_order: str = "mrv",
+    weights: Optional[List[int]] = None,
+) -> int:
+    """Find the empty tile to guess. Returns -1 if the board is full.
+
+    With ``tile_order="mrv"``, this is the empty tile with the fewest possible values
+    (minimum remaining values), and the first such tile in row-major order wins the
+    ties. The scan stops at a tile with a single possible value, which can be left by
+    ``propagation="none"``. ``"mrv_reverse"`` is the same, but scans the board from the
+    last tile. ``"static"`` picks the first empty tile in row-major order.
+    ``"mrv_degree"`` breaks the ties of ``"mrv"`` by picking the tile with the most
+    empty peers. ``"dom_wdeg"`` picks the tile with the lowest ratio between the number
+    of possible values and the sum of ``weights`` of its row, column, and block, only
+    counting the units that have other empty tiles.
+    """
+    if tile_order == "static":
+        for tile in range(81):
+            if not cells[tile]:
+                return tile
+        return -1
+    if tile_order == "mrv_degree":
+        empty = [tile for tile in range(81) if not cells[tile]]
+        if not empty:
+            return -1
+        best_n = min(NBITS[cands[tile]] for tile in empty)
+        return max(
+            (tile for tile in empty if NBITS[cands[tile]] == best_n),
+            key=lambda tile: sum(not cells[peer] for peer in PEERS[tile]),
+        )
+    if tile_order == "dom_wdeg":
+        empty = [tile for tile in range(81) if not cells[tile]]
+        if not empty:
+            return -1
+        if weights is None:
+            weights = [1] * len(UNITS)
+        nempty = [sum(not cells[tile] for tile in unit) for unit in UNITS]
+
+        def ratio(tile):
+            wdeg = sum(weights[uu] for uu in TILE_UNITS[tile] if nempty[uu] > 1)
+            return NBITS[cands[tile]] / wdeg if wdeg else float("inf")
+
+        return min(empty, key=ratio)
+    best = -1
+    best_n = 10
+    order = range(80, -1, -1) if tile_order == "mrv_reverse" else range(81)
+    for tile in order:
+        if not cells[tile]:
+            n = NBITS[cands[tile]]
+            if n < best_n:
+                best = tile
+                best_n = n
+                if n <= 1:
+                    break
+    return best
+
+
+def _order_values(
+    cells: List[int],
+    cands: List[int],
+    tile: int,
+    value_order: str = "ascending",
+    rng: Optional[random.Random] = None,
+) -> List[int]:
+    """Order the possible values of a tile to try.
+
+    ``"lcv"`` tries first the least constraining values, i.e., the values that are
+    possible in the fewest empty peers, and ``"random"`` shuffles the values with
+    ``rng``.
+    """
+    values = _mask_values(cands[tile])
+    if value_order == "descending":
+        values.reverse()
+    elif value_order == "lcv":
+        peer_cands = [cands[peer] for peer in PEERS[tile] if not cells[peer]]
+        values.sort(key=lambda val: sum(mask >> val & 1 for mask in peer_cands))
+    elif value_order == "random":
+        rng.shuffle(values)
+    return values
+
+
+def _check_options(
+    tile_order: str = "mrv",
+    value_order: str = "ascending",
+    propagation: str = "full",
+    seed: Optional[int] = None,
+):
+    """Check the options that configure the search."""
+    assert tile_order in tile_orders, f"tile_order should be one of {tile_orders}"
+    assert value_order in value_orders, f"value_order should be one of {value_orders}"
+    assert propagation in propagations, f"propagation should be one of {propagations}"
+
+
+def _iter_solutions(
+    cells: List[int],
+    cands: List[int],
+    tile_order: str = "mrv",
+    value_order: str = "ascending",
+    propagation: str = "full",
+    seed: Optional[int] = None,
+) -> Iterator[List[int]]:
+    """Depth-first search that yields every solution, starting from the given state.
+
+    The search keeps an explicit stack with one state per guess, i.e., the board, the
+    possible values, the guessed tile, and the values left to try in that tile. Thus,
+    the memory is bounded by the depth of the search, and the search resumes from where
+    it stops each time a solution is requested.
+    """
+    _check_options(tile_order, value_order, propagation)
+    rng = random.Random(seed) if value_order == "random" else None
+    # Weights of the units where the search fails, only used by "dom_wdeg"
+    weights = [1] * len(UNITS) if tile_order == "dom_wdeg" else None
+    if not _propagate(cells, cands, propagation, weights):
+        return
+    stack = []
+    while True:
+        tile = _pick_tile(cells, cands, tile_order, weights)
+        if tile < 0:
+            yield cells
+        else:
+            values = _order_values(cells, cands, tile, value_order, rng)
+            values.reverse()  # The next value to try is popped from the end
+            stack.append((cells, cands, tile, values))
+        # Try the next value in the deepest guess that still has values left
+        while stack:
+            prev_cells, prev_cands, tile, values = stack[-1]
+            val = values.pop()
+            if values:
+                cells = list(prev_cells)
+                cands = list(prev_cands)
+            else:
+                # Last value to try, the stored state can be reused
+                stack.pop()
+                cells = prev_cells
+                cands = prev_cands
+            _place(cells, cands, tile, val)
+            if _propagate(cells, cands, propagation, weights):
+                break
+        else:
+            return
+
+
+def _to_cells(board: Sequence[Sequence[int]]) -> List[int]:
+    """Flatten the board into a list of 81 values."""
+    cells = [int(val) for row in board for val in row]
+    assert len(cells) == 81, "The board should be a 9x9 array-like"
+    assert all(0 <= val <= 9 for val in cells), "The values should be between 0 and 9"
+    return cells
+
+
+def _to_board(cells: List[int]) -> List[List[int]]:
+    """Reshape a list of 81 values into a 9x9 nested list."""
+    return [cells[ii * 9 : (ii + 1) * 9] for ii in range(9)]
+
+
+def iter_solutions(
+    board: Sequence[Sequence[int]], **kwargs
+) -> Iterator[List[List[int]]]:
+    """Iterate over all solutions of a Sudoku problem.
+
+    The solutions are generated lazily, so the consumer can stop at any point, e.g.,
+    with ``itertools.islice`` to get the first few solutions.
+
+    Parameters
+    ----------
+    board: array-like (9, 9,)
+        The Sudoku problem, where the value of zero means that the tile is empty.
+    kwargs
+        Options to configure the search, see :func:`solve_board`.
+
+    Yields
+    ------
+    list
+        Each solution as a :math:`9 \\times 9` nested list.
+    """
+    cells = _to_cells(board)
+    cands = _initial_candidates(cells)
+    if cands is None:
+        return
+    for solution in _iter_solutions(cells, cands, **kwargs):
+        yield _to_board(solution)
+
+
+def solve_board(
+    board: Sequence[Sequence[int]],
+    tile_order: str = "mrv",
+    value_order: str = "ascending",
+    propagation: str = "full",
+    seed: Optional[int] = None,
+) -> Optional[List[List[int]]]:
+    """Solve a Sudoku problem.
+
+    Different options can be much faster or slower on a given problem, so it can be
+    worth trying several of them at once, see :func:`~sudoku.portfolio.solve_portfolio`.
+
+    Parameters
+    ----------
+    board: array-like (9, 9,)
+        The Sudoku problem, where the value of zero means that the tile is empty.
+    tile_order: str {"mrv", "mrv_reverse", "static", "mrv_degree", "dom_wdeg"}
+        How to choose the tile to guess. ``"mrv"`` picks the tile with the fewest
+        possible values, starting from the first tile, ``"mrv_reverse"`` does the same
+        starting from the last tile, and ``"static"`` picks the first empty tile.
+        ``"mrv_degree"`` breaks the ties of ``"mrv"`` by picking the tile that shares
+        a row, column, or block with the most empty tiles. ``"dom_wdeg"`` picks the
+        tile with the lowest ratio between its number of possible values and the
+        weights of its row, column, and block, where the weights count how many times
+        the search fails in them.
+    value_order: str {"ascending", "descending", "lcv", "random"}
+        The order of the values to try in the guessed tile. ``"lcv"`` tries first the
+        least constraining values, i.e., the values that are possible in the fewest
+        other empty tiles in the same row, column, or block. ``"random"`` shuffles the
+        values, using ``seed``.
+    propagation: str {"full", "naked", "none"}
+        Which tiles are filled without guessing. ``"full"`` fills the tiles with a
+        single possible value and the values with a single possible tile in a row,
+        column, or block, ``"naked"`` only does the former, and ``"none"`` only guesses.
+    seed: int
+        Seed of the random number generator used by ``value_order="random"``.
+
+    Returns
+    -------
+    list
+        The solved board as a :math:`9 \\times 9` nested list, or None if the problem
+        has no solution.
+    """
+    solutions = iter_solutions(
+        board,
+        tile_order=tile_order,
+        value_order=value_order,
+        propagation=propagation,
+        seed=seed,
+    )
+    return next(solutions, None)
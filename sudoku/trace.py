@@ -0,0 +1,117 @@
+"""Record where the solving time is spent.
+
+A :class:`Tracer` records spans, i.e., named phases with a start time and a duration,
+such as the propagation passes, each rule, and the guesses and reverts of the search in
+:meth:`~sudoku.Board.solve`. The spans can be written in the Chrome trace event format,
+which can be opened in ``chrome://tracing`` or https://ui.perfetto.dev, or in the folded
+stack format used by flame graph tools, e.g., ``flamegraph.pl``.
+
+Example
+-------
+>>> tracer = Tracer()
+>>> board = Board(problem)
+>>> board.solve(tracer=tracer)
+>>> tracer.write_chrome_trace("trace.json")
+>>> tracer.write_folded("trace.folded")
+"""
+
+import contextlib
+import json
+import os
+import time
+from collections import defaultdict
+from typing import Dict, List
+
+# A context manager that does nothing, used in place of a span when nothing is traced
+null_span = contextlib.nullcontext()
+
+
+class Tracer:
+    """Collect spans and instant events of a solving process."""
+
+    def __init__(self):
+        self.events = []
+        self._stack = []  # Names of the open spans
+        self._child_time = [0.0]  # Time spent in the children of each open span
+        self._self_times = defaultdict(float)  # Self time of each stack, in seconds
+        self._start_time = time.perf_counter()
+        self._pid = os.getpid()
+
+    def _timestamp(self, t: float) -> float:
+        """Convert a time from ``time.perf_counter`` into microseconds since the tracer
+        is created.
+        """
+        return (t - self._start_time) * 1e6
+
+    @contextlib.contextmanager
+    def span(self, name: str, **args):
+        """Record the time spent in a block of code.
+
+        Parameters
+        ----------
+        name: str
+            Name of the span.
+        args
+            Additional information stored with the span, e.g., the search depth.
+        """
+        self._stack.append(name)
+        self._child_time.append(0.0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            child_time = self._child_time.pop()
+            self._child_time[-1] += duration
+            self._self_times[";".join(self._stack)] += duration - child_time
+            self.events.append(
+                {
+                    "name": name,
+                    "ph": "X",
+                    "ts": self._timestamp(start),
+                    "dur": duration * 1e6,
+                    "pid": self._pid,
+                    "tid": 0,
+                    "args": dict(args, depth=len(self._stack) - 1),
+                }
+            )
+            self._stack.pop()
+
+    def instant(self, name: str, **args):
+        """Record an event that has no duration, e.g., a guess."""
+        self.events.append(
+            {
+                "name": name,
+                "ph": "i",
+                "s": "t",
+                "ts": self._timestamp(time.perf_counter()),
+                "pid": self._pid,
+                "tid": 0,
+                "args": dict(args, depth=len(self._stack)),
+            }
+        )
+
+    def chrome_trace(self) -> Dict:
+        """The recorded events in the Chrome trace event format."""
+        events = sorted(self.events, key=lambda event: event["ts"])
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def folded(self) -> List[str]:
+        """The self time of each stack of spans in the folded stack format, i.e., one
+        line per stack with the span names separated by ";" followed by the time in
+        microseconds.
+        """
+        return [
+            f"{stack} {round(self_time * 1e6)}"
+            for stack, self_time in sorted(self._self_times.items())
+        ]
+
+    def write_chrome_trace(self, path: str):
+        """Write the events into a JSON file in the Chrome trace event format."""
+        with open(path, "w") as f:
+            json.dump(self.chrome_trace(), f)
+
+    def write_folded(self, path: str):
+        """Write the stacks into a file in the folded stack format."""
+        with open(path, "w") as f:
+            f.write("\n".join(self.folded()) + "\n")
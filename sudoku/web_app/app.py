@@ -1,9 +1,24 @@
-from flask import Flask, render_template, request, jsonify
-from sudoku import generate_problem, Board
+from collections import OrderedDict
+import json
+import threading
+import time
+import uuid
+
+from flask import Flask, render_template, request, jsonify, abort, Response
+from flask import stream_with_context
+from sudoku import generate_problem, generate_problems, Board
+from sudoku.formats import parse_boards
+from sudoku.session import PlaySession
+from sudoku.solver import solve_board
 import numpy as np
 
 app = Flask(__name__)
 
+# Game sessions of the players, the least recently used ones are dropped first
+max_sessions = 10000
+sessions = OrderedDict()
+sessions_lock = threading.Lock()
+
 
 @app.route("/", methods=["GET", "POST"])
 def index():
@@ -56,6 +71,161 @@ def check_solution():
     return jsonify({"solved": solved})
 
 
+def _get_session(session_id):
+    """Retrieve a game session and mark it as recently used."""
+    session = sessions.get(session_id)
+    if session is None:
+        abort(404)
+    sessions.move_to_end(session_id)
+    return session
+
+
+def _session_state(session):
+    return {
+        "board": session.board,
+        "conflicts": session.conflicts,
+        "solved": session.solved,
+    }
+
+
+@app.route("/session", methods=["POST"])
+def create_session():
+    """Start a game, either from a given problem or from a generated one."""
+    data = request.get_json(silent=True) or {}
+    if not isinstance(data, dict):
+        return jsonify({"error": "The request should be a JSON object"}), 400
+    problem = data.get("problem")
+    try:
+        if problem is None:
+            problem = generate_problem(int(data.get("level", 3))).tolist()
+        session = PlaySession(problem)
+    except (TypeError, ValueError, AssertionError) as err:
+        return jsonify({"error": str(err)}), 400
+    if session.solution is None:
+        return jsonify({"error": "The problem has no solution"}), 400
+    session_id = uuid.uuid4().hex
+    with sessions_lock:
+        sessions[session_id] = session
+        while len(sessions) > max_sessions:
+            sessions.popitem(last=False)
+    return jsonify({"session_id": session_id, "problem": problem})
+
+
+@app.route("/session/<session_id>/move", methods=["POST"])
+def session_move(session_id):
+    """Set or clear (value 0) a tile, and report the conflicts after the move."""
+    data = request.get_json()
+    with sessions_lock:
+        session = _get_session(session_id)
+        try:
+            session.set_value(int(data["row"]), int(data["column"]), int(data["value"]))
+        except (KeyError, TypeError, ValueError, AssertionError) as err:
+            return jsonify({"error": str(err)}), 400
+        return jsonify(_session_state(session))
+
+
+@app.route("/session/<session_id>/hint", methods=["GET"])
+def session_hint(session_id):
+    with sessions_lock:
+        session = _get_session(session_id)
+        return jsonify({"hint": session.hint()})
+
+
+# Maximum number of problems generated in one batch request
+max_generate_batch = 10000
+
+
+def _ndjson_response(lines):
+    """Stream the JSON objects, one per line, as they are produced."""
+    return Response(
+        stream_with_context(json.dumps(line) + "\n" for line in lines),
+        mimetype="application/x-ndjson",
+    )
+
+
+def _solve_lines(stream):
+    """Solve the problem on each line of the stream. Each line is a JSON object with
+    a "board" key, as in data/board_*.json, or a board written as 81 characters.
+    """
+    index = 0  # Position of the problem, not counting the blank lines
+    for line in stream:
+        line = line.decode() if isinstance(line, bytes) else line
+        if not line.strip():
+            continue
+        start_time = time.perf_counter()
+        result = {"index": index}
+        try:
+            item = json.loads(line) if line.lstrip().startswith("{") else {}
+            if "id" in item:
+                result["id"] = item["id"]
+            boards = parse_boards(line)
+            if len(boards) != 1:
+                raise ValueError("Each line should contain exactly 1 board")
+            solution = solve_board(boards[0])
+            if solution is None:
+                result["status"] = "no_solution"
+            else:
+                result["status"] = "solved"
+                result["solution"] = solution
+        except (KeyError, TypeError, ValueError, AssertionError) as err:
+            result["status"] = "error"
+            result["error"] = str(err)
+        result["time"] = time.perf_counter() - start_time
+        index += 1
+        yield result
+
+
+@app.route("/api/solve/batch", methods=["POST"])
+def solve_batch():
+    """Solve the problems sent as newline-delimited JSON. The results are streamed
+    back as newline-delimited JSON, in the same order, as each problem is solved.
+    """
+    return _ndjson_response(_solve_lines(request.stream))
+
+
+def _generate_lines(n, level, seed):
+    """Generate the problems one by one."""
+    problems = generate_problems(n, level, seed, workers=1)
+    for index in range(n):
+        start_time = time.perf_counter()
+        problem = next(problems)
+        yield {
+            "index": index,
+            "status": "generated",
+            "problem": problem.tolist(),
+            "time": time.perf_counter() - start_time,
+        }
+
+
+@app.route("/api/generate/batch", methods=["GET", "POST"])
+def generate_batch():
+    """Generate ``n`` problems with the given ``level`` and optional ``seed``, read from
+    the query parameters or the JSON body. The same seed gives the same problems. The
+    problems are streamed back as newline-delimited JSON as each one is generated.
+    """
+    params = dict(request.args)
+    params.update(request.get_json(silent=True) or {})
+    try:
+        n = int(params.get("n", 1))
+        level = int(params.get("level", 3))
+        seed = None if params.get("seed") is None else int(params["seed"])
+    except (TypeError, ValueError) as err:
+        return jsonify({"error": str(err)}), 400
+    if seed is not None and seed < 0:
+        return jsonify({"error": "seed should be a non-negative integer"}), 400
+    if not 0 < n <= max_generate_batch or not 1 <= level <= 5:
+        return (
+            jsonify(
+                {
+                    "error": f"n should be between 1 and {max_generate_batch}, "
+                    "and level between 1 and 5"
+                }
+            ),
+            400,
+        )
+    return _ndjson_response(_generate_lines(n, level, seed))
+
+
 # Add the main() function to start the Flask app
 def main():
     app.run(debug=True)
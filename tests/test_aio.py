@@ -0,0 +1,63 @@
+from pathlib import Path
+import asyncio
+import glob
+import json
+
+import numpy as np
+
+from sudoku import Board, solve_many_async
+
+board_files = sorted(Path(f).absolute() for f in glob.glob("../data/board_*.json"))
+data = [json.load(open(board_file, "r")) for board_file in board_files]
+
+
+def test_solve_async():
+    problem = data[0]["board"]
+    solution = data[0]["solution"]
+    board = Board(problem)
+    asyncio.run(board.solve_async(yield_every=5))
+    assert np.allclose(board.board, solution)
+
+
+def test_solve_many_async():
+    problems = [d["board"] for d in data]
+    solutions = [d["solution"] for d in data]
+
+    async def run():
+        # Another task on the same loop should keep running while the boards are solved
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(None)
+                await asyncio.sleep(0)
+
+        tick_task = asyncio.ensure_future(ticker())
+        boards = await solve_many_async(problems, concurrency=4)
+        tick_task.cancel()
+        return boards, len(ticks)
+
+    boards, nticks = asyncio.run(run())
+    assert nticks > len(problems)
+    for board, solution in zip(boards, solutions):
+        assert np.allclose(board.board, solution)
+
+
+def test_solve_async_timeout():
+    board = Board(data[0]["board"])
+
+    async def run():
+        await asyncio.wait_for(board.solve_async(), timeout=0)
+
+    try:
+        asyncio.run(run())
+    except asyncio.TimeoutError:
+        pass
+    else:
+        raise AssertionError("Timeout is not raised")
+
+
+if __name__ == "__main__":
+    test_solve_async()
+    test_solve_many_async()
+    test_solve_async_timeout()
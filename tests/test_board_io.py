@@ -0,0 +1,73 @@
+import json
+import mmap
+import tempfile
+
+import numpy as np
+
+from sudoku import Board
+
+data = json.load(open("../data/board_01.json", "r"))
+problem = np.array(data["board"])
+solution = np.array(data["solution"])
+string = "".join(str(v) for v in problem.flatten())
+
+
+def test_uint8_board():
+    board = Board(data["board"])
+    assert board.board.dtype == np.uint8
+    assert board.board.flags["C_CONTIGUOUS"]
+    assert board.board.nbytes == 81
+    # The working board is a separate copy of the problem
+    board.solve()
+    assert np.allclose(board.board, solution)
+    assert np.allclose(board.orig_board, problem)
+
+
+def test_invalid_values():
+    # The values are checked before they are converted to uint8
+    for values in [np.full((9, 9), 256), np.full((9, 9), 265), np.full((9, 9), -1)]:
+        try:
+            Board(values)
+        except AssertionError:
+            pass
+        else:
+            raise AssertionError("Values outside 0-9 should be rejected")
+    try:
+        Board(problem + 0.5)
+    except AssertionError:
+        pass
+    else:
+        raise AssertionError("Non-integer values should be rejected")
+    assert np.allclose(Board(problem.astype(float)).orig_board, problem)
+
+
+def test_from_string():
+    board = Board.from_string(string)
+    assert np.allclose(board.orig_board, problem)
+    board = Board.from_string(string.replace("0", "."))
+    assert np.allclose(board.orig_board, problem)
+
+
+def test_from_buffer():
+    # Store several boards back to back and read one of them without copying
+    buffer = Board(problem).to_bytes() * 3
+    board = Board.from_buffer(buffer, offset=81)
+    assert np.shares_memory(board.orig_board, np.frombuffer(buffer, dtype=np.uint8))
+    board.solve()
+    assert np.allclose(board.board, solution)
+    assert Board.from_buffer(board.to_bytes()).solved
+
+    with tempfile.TemporaryFile() as f:
+        f.write(buffer)
+        f.flush()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            board = Board.from_buffer(mm, offset=162)
+            assert np.allclose(board.orig_board, problem)
+            del board
+
+
+if __name__ == "__main__":
+    test_uint8_board()
+    test_invalid_values()
+    test_from_string()
+    test_from_buffer()
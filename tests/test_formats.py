@@ -0,0 +1,74 @@
+import io
+import json
+
+import numpy as np
+
+from sudoku import main
+from sudoku.formats import parse_boards, format_grid, format_line, format_json
+
+data = json.load(open("../data/board_01.json", "r"))
+problem = data["board"]
+solution = data["solution"]
+line = format_line(problem)
+grid = "\n".join(line[ii * 9 : (ii + 1) * 9] for ii in range(9))
+
+
+def test_parse_boards():
+    # The same board in all formats
+    texts = {
+        "json": json.dumps(data),
+        "line": line.replace("0", "."),
+        "grid": grid.replace("0", "_"),
+    }
+    for fmt, text in texts.items():
+        assert parse_boards(text, fmt) == [problem]
+        assert parse_boards(text) == [problem]
+    # Multiple boards
+    assert parse_boards("\n".join([line] * 3)) == [problem] * 3
+    assert parse_boards("\n\n".join([grid] * 3)) == [problem] * 3
+    assert parse_boards(json.dumps([data] * 3)) == [problem] * 3
+    assert parse_boards("\n".join([json.dumps(data)] * 3)) == [problem] * 3
+
+
+def test_format_roundtrip():
+    assert parse_boards(format_line(solution)) == [solution]
+    assert parse_boards(format_json(problem, solution)) == [problem]
+    assert len(format_grid(np.array(solution)).splitlines()) == 19
+
+
+def test_main_bulk(capsys):
+    assert main([line, line, "-o", "line"]) == 0
+    out = capsys.readouterr().out.split()
+    assert out == [format_line(solution)] * 2
+    assert main(["../data/board_01.json", "-o", "json", "-t"]) == 0
+    captured = capsys.readouterr()
+    assert json.loads(captured.out)["solution"] == solution
+    assert "Solved 1/1" in captured.err
+
+
+def test_main_bad_input(capsys, monkeypatch):
+    # A malformed line doesn't prevent the other boards from being solved
+    monkeypatch.setattr("sys.stdin", io.StringIO("\n".join([line, "123", line])))
+    assert main(["-o", "line", "-t"]) == 1
+    captured = capsys.readouterr()
+    assert captured.out.split() == [format_line(solution)] * 2
+    assert "<stdin>, line 2:" in captured.err
+    assert "Solved 2/3" in captured.err
+    # Neither a file nor a board
+    assert main(["missing.txt"]) == 1
+    assert "missing.txt: neither an existing file" in capsys.readouterr().err
+    # Boards that are parsed but aren't valid don't stop the other boards
+    bad_shape = json.dumps({"board": [[1, 2, 3]]})
+    bad_value = json.dumps({"board": [[10] * 9] * 9})
+    text = "\n".join([bad_shape, json.dumps(data), bad_value, json.dumps(data)])
+    monkeypatch.setattr("sys.stdin", io.StringIO(text))
+    assert main(["-o", "line"]) == 1
+    captured = capsys.readouterr()
+    assert captured.out.split() == [format_line(solution)] * 2
+    assert "<stdin>, line 1: The board should be a 9x9 array-like" in captured.err
+    assert "<stdin>, line 3: The values should be between 0 and 9" in captured.err
+
+
+if __name__ == "__main__":
+    test_parse_boards()
+    test_format_roundtrip()
@@ -1,5 +1,8 @@
+from itertools import islice
+
 import numpy as np
-from sudoku import generate_problem, Board
+from sudoku import generate_problem, generate_problems, Board
+from sudoku.solver import iter_solutions
 
 np.random.seed(1)
 
@@ -20,6 +23,78 @@ def test_board_solvable():
     assert B.solved, "Generated problem might not be solvable."
 
 
+def test_seed_reproducible():
+    """Test that the same seed gives the same problem."""
+    assert np.array_equal(generate_problem(2, seed=3), generate_problem(2, seed=3))
+
+
+def test_global_seed():
+    """Test that without a seed, the problems follow the global NumPy seed."""
+    np.random.seed(1)
+    problem = generate_problem(2)
+    problems = list(generate_problems(2, level=2, workers=1))
+    np.random.seed(1)
+    assert np.array_equal(problem, generate_problem(2))
+    for problem, other in zip(problems, generate_problems(2, level=2, workers=1)):
+        assert np.array_equal(problem, other)
+
+
+def test_seed_sequence_reused():
+    """Test that a SeedSequence gives the same problems when it is used again."""
+    seed = np.random.SeedSequence(5)
+    first = list(generate_problems(2, level=2, seed=seed, workers=1))
+    second = list(generate_problems(2, level=2, seed=seed, workers=1))
+    for problem, other in zip(first, second):
+        assert np.array_equal(problem, other)
+    assert seed.n_children_spawned == 0
+
+
+def test_generate_problems_workers():
+    """Test that the problems generated from a seed don't depend on the number of
+    processes.
+    """
+    serial = list(generate_problems(4, level=2, seed=5, workers=1))
+    parallel = list(generate_problems(4, level=2, seed=5, workers=2))
+    assert len(serial) == 4
+    for problem, other in zip(serial, parallel):
+        assert np.array_equal(problem, other)
+    # The problems are different from each other
+    assert not np.array_equal(serial[0], serial[1])
+
+
+def _nsolutions(problem):
+    """Count the solutions of a problem, up to 2."""
+    return len(list(islice(iter_solutions(problem), 2)))
+
+
+def test_minimal():
+    """Test that a minimal problem has a unique solution, and that removing any of its
+    clues gives more solutions.
+    """
+    problem = generate_problem(seed=7, minimal=True)
+    assert _nsolutions(problem) == 1
+    for row, col in zip(*np.nonzero(problem)):
+        dug = problem.copy()
+        dug[row, col] = 0
+        assert _nsolutions(dug) == 2
+
+
+def test_minimal_symmetry():
+    """Test that the clues of a symmetric minimal problem follow the pattern."""
+    problem = generate_problem(seed=7, minimal=True, symmetry="rotational")
+    assert _nsolutions(problem) == 1
+    assert np.array_equal(problem > 0, np.rot90(problem > 0, 2))
+    problem = generate_problem(seed=7, minimal=True, symmetry="mirror")
+    assert _nsolutions(problem) == 1
+    assert np.array_equal(problem > 0, np.fliplr(problem > 0))
+
+
 if __name__ == "__main__":
     test_number_empty_tiles()
     test_board_solvable()
+    test_seed_reproducible()
+    test_global_seed()
+    test_seed_sequence_reused()
+    test_generate_problems_workers()
+    test_minimal()
+    test_minimal_symmetry()
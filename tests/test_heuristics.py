@@ -0,0 +1,33 @@
+import itertools
+import json
+
+import numpy as np
+
+from sudoku import Board
+from sudoku.board import tile_orders, value_orders
+
+data = json.load(open("../data/board_12.json", "r"))
+problem = data["board"]
+solution = data["solution"]
+
+
+def test_heuristics():
+    for tile_order, value_order in itertools.product(tile_orders, value_orders):
+        board = Board(problem, tile_order, value_order, seed=1)
+        board.solve()
+        assert np.allclose(board.board, solution), (tile_order, value_order)
+        assert board.nguesses > 0
+
+
+def test_random_seed():
+    nguesses = []
+    for _ in range(2):
+        board = Board(problem, value_order="random", seed=3)
+        board.solve()
+        nguesses.append(board.nguesses)
+    assert nguesses[0] == nguesses[1]
+
+
+if __name__ == "__main__":
+    test_heuristics()
+    test_random_seed()
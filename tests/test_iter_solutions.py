@@ -0,0 +1,50 @@
+import itertools
+import json
+
+import numpy as np
+
+from sudoku import Board
+
+data = json.load(open("../data/board_01.json", "r"))
+problem = np.array(data["board"])
+solution = np.array(data["solution"])
+
+
+def test_unique_solution():
+    solutions = list(Board(problem).iter_solutions())
+    assert len(solutions) == 1
+    assert np.allclose(solutions[0], solution)
+
+
+def test_multiple_solutions():
+    # Swapping the first 2 rows of a solution gives another solution, so emptying these
+    # rows gives a problem with multiple solutions.
+    board = Board(solution)
+    board.orig_board[:2] = 0
+    solutions = list(board.iter_solutions())
+    assert len(solutions) > 1
+    assert len(set(s.tobytes() for s in solutions)) == len(solutions)
+    for s in solutions:
+        assert Board(s).solved
+        assert np.allclose(s[2:], solution[2:])
+
+
+def test_stop_early():
+    # An empty board has too many solutions to enumerate
+    solutions = list(itertools.islice(Board(np.zeros((9, 9))).iter_solutions(), 100))
+    assert len(solutions) == 100
+    assert len(set(s.tobytes() for s in solutions)) == 100
+    assert all(Board(s).solved for s in solutions)
+
+
+def test_no_solution():
+    board = Board(problem)
+    board.orig_board[2, 2] = 1  # Value 1 is already in this row
+    assert list(board.iter_solutions()) == []
+
+
+if __name__ == "__main__":
+    test_unique_solution()
+    test_multiple_solutions()
+    test_stop_early()
+    test_no_solution()
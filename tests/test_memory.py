@@ -0,0 +1,32 @@
+import json
+
+from sudoku import Board
+from sudoku.memory import measure_memory, check_budget
+
+data = json.load(open("../data/board_06.json", "r"))
+
+
+def test_solve_memory_budget():
+    """Solving a board needs less than 1 MiB and doesn't keep memory around."""
+    report = measure_memory(lambda: Board(data["board"]).solve(), nrepeat=3)
+    budget = {"peak_bytes": 1024 * 1024, "retained_bytes": 16 * 1024}
+    assert check_budget(report, budget) == []
+
+
+def test_intermediate_state_released():
+    board = Board(data["board"])
+    board.solve()
+    assert board.nguesses > 0
+    assert board._intermediate_state == {}
+
+
+def test_check_budget():
+    report = {"peak_bytes": 2048, "retained_bytes": 0}
+    assert check_budget(report, {"peak_bytes": 4096}) == []
+    assert len(check_budget(report, {"peak_bytes": 1024, "retained_bytes": 0})) == 1
+
+
+if __name__ == "__main__":
+    test_solve_memory_budget()
+    test_intermediate_state_released()
+    test_check_budget()
@@ -0,0 +1,45 @@
+from pathlib import Path
+import glob
+import json
+
+import numpy as np
+
+from sudoku import Board, solve_parallel
+
+board_files = sorted(Path(f).absolute() for f in glob.glob("../data/board_*.json"))
+
+
+def test_solve_parallel():
+    for board_file in board_files[-3:]:
+        data = json.load(open(board_file, "r"))
+        # Split the search even if the problem is easy
+        solution = solve_parallel(data["board"], workers=2, nsplit=16, propagation="none")
+        assert solution == data["solution"]
+
+
+def test_board_workers():
+    data = json.load(open(board_files[-1], "r"))
+    board = Board(data["board"])
+    board.solve(workers=2)
+    assert np.allclose(board.board, data["solution"])
+    # With the heuristics of the board
+    board = Board(data["board"], tile_order="dom_wdeg", value_order="random", seed=1)
+    board.solve(workers=2)
+    assert np.allclose(board.board, data["solution"])
+
+
+def test_no_solution():
+    problem = [[0] * 9 for _ in range(9)]
+    problem[0][:2] = [5, 5]
+    assert solve_parallel(problem, workers=2) is None
+    # The contradiction is only found by the search
+    problem = [[0] * 9 for _ in range(9)]
+    problem[0][:8] = [1, 2, 3, 4, 5, 6, 7, 8]
+    problem[1][8] = 9
+    assert solve_parallel(problem, workers=2, nsplit=4) is None
+
+
+if __name__ == "__main__":
+    test_solve_parallel()
+    test_board_workers()
+    test_no_solution()
@@ -0,0 +1,62 @@
+import json
+
+import numpy as np
+
+from sudoku import Board, solve_portfolio
+from sudoku.portfolio import default_portfolio
+
+data = json.load(open("../data/board_12.json", "r"))
+problem = data["board"]
+solution = data["solution"]
+
+
+def test_solve_portfolio():
+    result, config = solve_portfolio(problem)
+    assert result == solution
+    assert config in default_portfolio
+
+
+def test_board_portfolio():
+    portfolio = [
+        {"tile_order": "static", "propagation": "none"},
+        {"tile_order": "mrv", "value_order": "descending"},
+    ]
+    board = Board(problem)
+    config = board.solve(portfolio=portfolio)
+    assert np.allclose(board.board, solution)
+    # The options of the board fill in the options missing from the configuration
+    assert any(config.items() >= given.items() for given in portfolio)
+    assert config["value_order"] in ["ascending", "descending"]
+    assert board.portfolio_winner == config
+
+    # The heuristics of the board are also available in the portfolio
+    board = Board(problem, tile_order="mrv_degree", value_order="lcv")
+    portfolio = [{"propagation": "naked"}, {"tile_order": "dom_wdeg"}]
+    config = board.solve(portfolio=portfolio)
+    assert np.allclose(board.board, solution)
+    assert config["value_order"] == "lcv"
+
+
+def test_no_solution():
+    problem = [[0] * 9 for _ in range(9)]
+    problem[0][:2] = [5, 5]
+    result, config = solve_portfolio(problem, [{"tile_order": "mrv"}])
+    assert result is None
+
+
+def test_invalid_board():
+    # The board is checked before any process starts, instead of hanging
+    for problem in [[[10] * 9] * 9, [[0] * 9] * 8]:
+        try:
+            solve_portfolio(problem, timeout=10)
+        except AssertionError:
+            pass
+        else:
+            raise AssertionError("The board should be rejected")
+
+
+if __name__ == "__main__":
+    test_solve_portfolio()
+    test_board_portfolio()
+    test_no_solution()
+    test_invalid_board()
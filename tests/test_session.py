@@ -0,0 +1,86 @@
+import json
+import sys
+
+from sudoku.session import PlaySession
+
+sys.path.insert(0, "../sudoku/web_app")
+from app import app  # noqa: E402
+
+data = json.load(open("../data/board_01.json", "r"))
+problem = data["board"]
+solution = data["solution"]
+empty = [(i, j) for i in range(9) for j in range(9) if not problem[i][j]]
+
+
+def test_play():
+    session = PlaySession(problem)
+    assert not session.solved
+    for i, j in empty:
+        assert solution[i][j] in session.candidates(i, j)
+        session.set_value(i, j, solution[i][j])
+    assert session.board == solution
+    assert session.solved
+    assert session.hint() is None
+
+
+def test_conflicts():
+    session = PlaySession(problem)
+    i, j = empty[0]
+    # Put a value that is already in the same row
+    value = next(val for val in problem[i] if val)
+    changed = session.set_value(i, j, value)
+    assert (i, j) in changed
+    assert (i, j) in session.conflicts
+    assert len(session.conflicts) == 2
+    # Clearing the tile removes the conflicts
+    session.set_value(i, j, 0)
+    assert session.conflicts == []
+    assert session.candidates(i, j) == PlaySession(problem).candidates(i, j)
+
+
+def test_hint():
+    session = PlaySession(problem)
+    hint = session.hint()
+    assert hint["value"] == solution[hint["row"]][hint["column"]]
+    assert not hint["wrong"]
+    # A wrong value is pointed out
+    i, j = empty[-1]
+    session.set_value(i, j, solution[i][j] % 9 + 1)
+    hint = session.hint()
+    assert (hint["row"], hint["column"]) == (i, j) and hint["wrong"]
+
+
+def test_outside_board():
+    session = PlaySession(problem)
+    for row, column in [(0, -1), (0, 9), (9, 0), (-1, 0)]:
+        try:
+            session.set_value(row, column, 5)
+        except AssertionError:
+            pass
+        else:
+            raise AssertionError(f"Tile [{row}, {column}] should be rejected")
+    assert session.board == problem
+
+
+def test_create_session_invalid():
+    client = app.test_client()
+    # The request is not a JSON object
+    response = client.post("/session", json=[1, 2])
+    assert response.status_code == 400
+    # The problem has repeated values, so it has no solution
+    conflict = [[1] * 9] * 9
+    assert PlaySession(conflict).solution is None
+    response = client.post("/session", json={"problem": conflict})
+    assert response.status_code == 400
+    assert "error" in response.get_json()
+    # A valid problem
+    response = client.post("/session", json={"problem": problem})
+    assert response.status_code == 200
+
+
+if __name__ == "__main__":
+    test_play()
+    test_conflicts()
+    test_hint()
+    test_outside_board()
+    test_create_session_invalid()
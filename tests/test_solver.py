@@ -0,0 +1,63 @@
+from pathlib import Path
+import glob
+import itertools
+import json
+import os
+import subprocess
+import sys
+
+from sudoku.solver import solve_board, tile_orders, value_orders
+from sudoku.solver import _initial_candidates, _pick_tile
+
+board_files = sorted(Path(f).absolute() for f in glob.glob("../data/board_*.json"))
+package_root = str(Path("..").absolute())
+
+
+def test_solve_board():
+    for board_file in board_files:
+        data = json.load(open(board_file, "r"))
+        assert solve_board(data["board"]) == data["solution"]
+
+
+def test_options():
+    for board_file in board_files[-3:]:
+        data = json.load(open(board_file, "r"))
+        for tile_order, value_order in itertools.product(tile_orders, value_orders):
+            result = solve_board(data["board"], tile_order, value_order, seed=1)
+            assert result == data["solution"], (tile_order, value_order)
+
+
+def test_no_solution():
+    problem = [[0] * 9 for _ in range(9)]
+    problem[0][:2] = [5, 5]
+    assert solve_board(problem) is None
+
+
+def test_pick_tile_single():
+    """Without propagation, a tile with a single possible value is picked before an
+    earlier tile with 2 possible values.
+    """
+    cells = [0] * 81
+    cells[2:9] = [3, 4, 5, 6, 7, 8, 9]  # Tiles 0 and 1 can be 1 or 2
+    cells[72:80] = [3, 4, 5, 6, 7, 8, 9, 1]  # Tile 80 can only be 2
+    cands = _initial_candidates(cells)
+    assert _pick_tile(cells, cands, "mrv") == 80
+
+
+def test_lazy_import():
+    """Importing the package and running the command line tool don't import NumPy."""
+    code = (
+        "import sys, sudoku; from sudoku.main import main; main(['-o', 'line', "
+        "'0' * 81]); assert 'numpy' not in sys.modules; "
+        "assert callable(sudoku.main) and callable(sudoku.generate_problem)"
+    )
+    env = dict(os.environ, PYTHONPATH=package_root)
+    subprocess.run([sys.executable, "-c", code], env=env, check=True)
+
+
+if __name__ == "__main__":
+    test_solve_board()
+    test_options()
+    test_no_solution()
+    test_pick_tile_single()
+    test_lazy_import()
@@ -0,0 +1,49 @@
+import json
+import tempfile
+from pathlib import Path
+
+from sudoku import Board
+from sudoku.trace import Tracer
+
+data = json.load(open("../data/board_12.json", "r"))
+
+
+def test_trace():
+    tracer = Tracer()
+    board = Board(data["board"])
+    board.solve(tracer=tracer)
+    assert board.solved
+
+    names = set(event["name"] for event in tracer.events)
+    for name in ["solve", "step", "propagate", "branch", "guess", "revert"]:
+        assert name in names
+    # The solve span contains all the other spans
+    solve = next(event for event in tracer.events if event["name"] == "solve")
+    for event in tracer.events:
+        assert event["ts"] >= solve["ts"]
+        assert event["ts"] + event.get("dur", 0) <= solve["ts"] + solve["dur"] + 1
+    guesses = [event for event in tracer.events if event["name"] == "guess"]
+    assert len(guesses) == board.nguesses
+
+    # The self times of the folded stacks add up to the duration of the solve
+    folded = tracer.folded()
+    assert all(line.startswith("solve") for line in folded)
+    total = sum(int(line.rsplit(" ", 1)[1]) for line in folded)
+    assert abs(total - solve["dur"]) < 0.01 * solve["dur"] + len(folded)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tracer.write_chrome_trace(Path(tmpdir) / "trace.json")
+        trace = json.load(open(Path(tmpdir) / "trace.json", "r"))
+        assert len(trace["traceEvents"]) == len(tracer.events)
+        tracer.write_folded(Path(tmpdir) / "trace.folded")
+
+    # The tracer is only used for the traced solve
+    nevents = len(tracer.events)
+    board.reset()
+    board.solve()
+    assert board.tracer is None
+    assert len(tracer.events) == nevents
+
+
+if __name__ == "__main__":
+    test_trace()